@@ -0,0 +1,17 @@
+import asyncio
+import time
+
+import pytest
+
+
+@pytest.mark.asyncio(loop_factories=["virtual_time"])
+async def test_sleep_completes_instantly():
+    wall_clock_start = time.monotonic()
+    await asyncio.sleep(3600)
+    assert time.monotonic() - wall_clock_start < 1
+
+
+@pytest.mark.asyncio(loop_factories=["virtual_time"])
+async def test_timeout_expires_instantly():
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(asyncio.sleep(3600), timeout=60)
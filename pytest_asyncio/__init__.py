@@ -4,8 +4,20 @@ from __future__ import annotations
 
 from importlib.metadata import version
 
-from .plugin import fixture, is_async_test
+from .plugin import (
+    AsyncBenchmark,
+    UnusedPortFactory,
+    VirtualTimeEventLoop,
+    fixture,
+    is_async_test,
+)
 
 __version__ = version(__name__)
 
-__all__ = ("fixture", "is_async_test")
+__all__ = (
+    "AsyncBenchmark",
+    "UnusedPortFactory",
+    "VirtualTimeEventLoop",
+    "fixture",
+    "is_async_test",
+)
@@ -3,15 +3,28 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import contextlib
 import contextvars
 import enum
 import functools
 import inspect
+import itertools
+import json
+import operator
+import os
+import selectors
+import shutil
 import socket
+import statistics
 import sys
+import tempfile
+import textwrap
+import threading
+import time
 import traceback
 import warnings
+import weakref
 from asyncio import AbstractEventLoop
 from collections.abc import (
     AsyncIterable,
@@ -20,16 +33,20 @@ from collections.abc import (
     Callable,
     Collection,
     Generator,
+    Hashable,
     Iterable,
     Iterator,
     Mapping,
     Sequence,
 )
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from types import AsyncGeneratorType, CoroutineType
 from typing import (
     TYPE_CHECKING,
     Any,
     Literal,
+    NamedTuple,
     ParamSpec,
     TypeAlias,
     TypeVar,
@@ -52,6 +69,8 @@ from pytest import (
     PytestCollectionWarning,
     PytestDeprecationWarning,
     PytestPluginManager,
+    StashKey,
+    TempPathFactory,
 )
 
 if sys.version_info >= (3, 11):
@@ -59,6 +78,14 @@ if sys.version_info >= (3, 11):
 else:
     from backports.asyncio.runner import Runner
 
+if sys.version_info < (3, 11):
+    from exceptiongroup import BaseExceptionGroup
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
 if sys.version_info >= (3, 13):
     from typing import TypeIs
 else:
@@ -72,6 +99,7 @@ if TYPE_CHECKING:
 _ScopeName = Literal["session", "package", "module", "class", "function"]
 _R = TypeVar("_R", bound=Awaitable | AsyncIterable | AsyncIterator)
 _P = ParamSpec("_P")
+_T = TypeVar("_T")
 FixtureFunction = Callable[_P, _R]
 LoopFactory: TypeAlias = Callable[[], AbstractEventLoop]
 
@@ -123,6 +151,13 @@ def pytest_addoption(parser: Parser, pluginmanager: PytestPluginManager) -> None
         default=None,
         help="enable asyncio debug mode for the default event loop",
     )
+    group.addoption(
+        "--asyncio-loop-stats",
+        dest="asyncio_loop_stats",
+        action="store_true",
+        default=None,
+        help="record event loop lag and callback durations for each test",
+    )
     parser.addini(
         "asyncio_mode",
         help="default value for --asyncio-mode",
@@ -134,6 +169,12 @@ def pytest_addoption(parser: Parser, pluginmanager: PytestPluginManager) -> None
         type="bool",
         default="false",
     )
+    parser.addini(
+        "asyncio_loop_stats",
+        help="record event loop lag and callback durations for each test",
+        type="bool",
+        default="false",
+    )
     parser.addini(
         "asyncio_default_fixture_loop_scope",
         type="string",
@@ -146,6 +187,72 @@ def pytest_addoption(parser: Parser, pluginmanager: PytestPluginManager) -> None
         help="default scope of the asyncio event loop used to execute tests",
         default="function",
     )
+    parser.addini(
+        "asyncio_leaked_tasks",
+        type="string",
+        help="how to report tasks still pending after a test or when an event "
+        "loop is closed: ignore, warn or error",
+        default="ignore",
+    )
+    parser.addini(
+        "asyncio_propagate_fixture_context",
+        type="bool",
+        help="copy contextvar changes made by async fixtures into the context "
+        "of the test",
+        default="true",
+    )
+    parser.addini(
+        "asyncio_default_timeout",
+        type="string",
+        help="default number of seconds after which async tests are cancelled "
+        "(0 means no timeout)",
+        default="0",
+    )
+    parser.addini(
+        "asyncio_concurrent_fixture_setup",
+        type="bool",
+        help="set up independent async fixtures of a test concurrently",
+        default="false",
+    )
+    parser.addini(
+        "asyncio_concurrent_fixture_teardown",
+        type="bool",
+        help="tear down async generator fixtures sharing an event loop concurrently",
+        default="false",
+    )
+    parser.addini(
+        "asyncio_function_loop_pool",
+        type="bool",
+        help="reset and reuse event loops between tests with function loop scope",
+        default="false",
+    )
+    parser.addini(
+        "asyncio_loop_thread",
+        type="bool",
+        help="run each scoped event loop forever on a dedicated thread and submit "
+        "coroutines to it",
+        default="false",
+    )
+    parser.addini(
+        "asyncio_task_factory",
+        type="string",
+        help="task factory of the event loops created by pytest-asyncio: "
+        "default or eager",
+        default="default",
+    )
+    parser.addini(
+        "asyncio_shared_executor",
+        type="bool",
+        help="use a session-wide thread pool as default executor of event loops",
+        default="false",
+    )
+    parser.addini(
+        "asyncio_shared_executor_workers",
+        type="string",
+        help="maximum number of worker threads of the shared default executor "
+        "(0 uses the default of ThreadPoolExecutor)",
+        default="0",
+    )
 
 
 @overload
@@ -154,6 +261,7 @@ def fixture(
     *,
     scope: _ScopeName | Callable[[str, Config], _ScopeName] = ...,
     loop_scope: _ScopeName | None = ...,
+    propagate_context: bool | None = ...,
     params: Iterable[object] | None = ...,
     autouse: bool = ...,
     ids: (
@@ -171,6 +279,7 @@ def fixture(
     *,
     scope: _ScopeName | Callable[[str, Config], _ScopeName] = ...,
     loop_scope: _ScopeName | None = ...,
+    propagate_context: bool | None = ...,
     params: Iterable[object] | None = ...,
     autouse: bool = ...,
     ids: (
@@ -185,20 +294,26 @@ def fixture(
 def fixture(
     fixture_function: FixtureFunction[_P, _R] | None = None,
     loop_scope: _ScopeName | None = None,
+    propagate_context: bool | None = None,
     **kwargs: Any,
 ) -> (
     FixtureFunction[_P, _R]
     | Callable[[FixtureFunction[_P, _R]], FixtureFunction[_P, _R]]
 ):
     if fixture_function is not None:
-        _make_asyncio_fixture_function(fixture_function, loop_scope)
+        _make_asyncio_fixture_function(fixture_function, loop_scope, propagate_context)
         return pytest.fixture(fixture_function, **kwargs)
 
     else:
 
         @functools.wraps(fixture)
         def inner(fixture_function: FixtureFunction[_P, _R]) -> FixtureFunction[_P, _R]:
-            return fixture(fixture_function, loop_scope=loop_scope, **kwargs)
+            return fixture(
+                fixture_function,
+                loop_scope=loop_scope,
+                propagate_context=propagate_context,
+                **kwargs,
+            )
 
         return inner
 
@@ -208,19 +323,22 @@ def _is_asyncio_fixture_function(obj: Any) -> bool:
     return getattr(obj, "_force_asyncio_fixture", False)
 
 
-def _make_asyncio_fixture_function(obj: Any, loop_scope: _ScopeName | None) -> None:
+def _make_asyncio_fixture_function(
+    obj: Any, loop_scope: _ScopeName | None, propagate_context: bool | None = None
+) -> None:
     if hasattr(obj, "__func__"):
         # instance method, check the function object
         obj = obj.__func__
     obj._force_asyncio_fixture = True
     obj._loop_scope = loop_scope
+    obj._propagate_context = propagate_context
 
 
 def _is_coroutine_or_asyncgen(obj: Any) -> bool:
     return inspect.iscoroutinefunction(obj) or inspect.isasyncgenfunction(obj)
 
 
-def _get_asyncio_mode(config: Config) -> Mode:
+def _parse_asyncio_mode(config: Config) -> Mode:
     val = config.getoption("asyncio_mode")
     if val is None:
         val = config.getini("asyncio_mode")
@@ -233,17 +351,136 @@ def _get_asyncio_mode(config: Config) -> Mode:
         ) from e
 
 
-def _get_asyncio_debug(config: Config) -> bool:
-    val = config.getoption("asyncio_debug")
-    if val is None:
-        val = config.getini("asyncio_debug")
-
+def _parse_bool_ini(config: Config, name: str) -> bool:
+    val = config.getini(name)
     if isinstance(val, bool):
         return val
     else:
         return val == "true"
 
 
+def _parse_asyncio_debug(config: Config) -> bool:
+    val = config.getoption("asyncio_debug")
+    if val is None:
+        return _parse_bool_ini(config, "asyncio_debug")
+    return val
+
+
+def _parse_asyncio_loop_stats(config: Config) -> bool:
+    val = config.getoption("asyncio_loop_stats")
+    if val is None:
+        return _parse_bool_ini(config, "asyncio_loop_stats")
+    return val
+
+
+def _parse_default_timeout(config: Config) -> float | None:
+    val = config.getini("asyncio_default_timeout")
+    try:
+        timeout = float(val)
+    except ValueError:
+        timeout = -1
+    if timeout < 0:
+        raise pytest.UsageError(
+            f"{val!r} is not a valid asyncio_default_timeout. "
+            "Expected a non-negative number of seconds."
+        )
+    return timeout or None
+
+
+_LEAKED_TASKS_MODES = ("ignore", "warn", "error")
+
+
+def _parse_leaked_tasks_mode(config: Config) -> str:
+    val = config.getini("asyncio_leaked_tasks")
+    if val not in _LEAKED_TASKS_MODES:
+        raise pytest.UsageError(
+            f"{val!r} is not a valid asyncio_leaked_tasks. "
+            f"Valid values are: {', '.join(_LEAKED_TASKS_MODES)}."
+        )
+    return val
+
+
+_TASK_FACTORIES = ("default", "eager")
+
+
+def _parse_task_factory_name(config: Config) -> str:
+    val = config.getini("asyncio_task_factory")
+    if val not in _TASK_FACTORIES:
+        raise pytest.UsageError(
+            f"{val!r} is not a valid asyncio_task_factory. "
+            f"Valid values are: {', '.join(_TASK_FACTORIES)}."
+        )
+    if val == "eager" and sys.version_info < (3, 12):
+        raise pytest.UsageError(
+            "asyncio_task_factory = eager requires Python 3.12 or later."
+        )
+    return val
+
+
+def _resolve_task_factory(name: str) -> Callable[..., asyncio.Task] | None:
+    if name == "eager":
+        return asyncio.eager_task_factory  # type: ignore[attr-defined]
+    return None
+
+
+# The task factories that event loops had, before pytest-asyncio changed them
+_original_task_factories: weakref.WeakKeyDictionary[
+    AbstractEventLoop, Callable[..., asyncio.Future] | None
+] = weakref.WeakKeyDictionary()
+
+
+def _remember_task_factory(loop: AbstractEventLoop) -> None:
+    # Loops that don't support weak references keep their task factory
+    # untracked, so the "default" task factory leaves them alone.
+    with contextlib.suppress(TypeError):
+        _original_task_factories.setdefault(loop, loop.get_task_factory())
+
+
+@contextlib.contextmanager
+def _overriding_task_factory(
+    loop: AbstractEventLoop, name: str | None
+) -> Iterator[None]:
+    """
+    Use the named task factory on the loop, unless the name is None.
+
+    The "default" task factory is the task factory the loop had when it was
+    created, which may have been set by a custom loop factory.
+    """
+    if name is None:
+        yield
+        return
+    task_factory: Callable[..., asyncio.Future] | None
+    if name == "default":
+        try:
+            task_factory = _original_task_factories[loop]
+        except (KeyError, TypeError):
+            # pytest-asyncio never changed the task factory of the loop
+            yield
+            return
+    else:
+        task_factory = _resolve_task_factory(name)
+    previous_task_factory = loop.get_task_factory()
+    loop.set_task_factory(task_factory)
+    try:
+        yield
+    finally:
+        loop.set_task_factory(previous_task_factory)
+
+
+def _parse_shared_executor_workers(config: Config) -> int | None:
+    val = config.getini("asyncio_shared_executor_workers")
+    try:
+        workers = int(val)
+    except ValueError:
+        workers = -1
+    if workers < 0:
+        raise pytest.UsageError(
+            f"{val!r} is not a valid asyncio_shared_executor_workers. "
+            "Expected a non-negative integer."
+        )
+    return workers or None
+
+
 _INVALID_LOOP_FACTORIES = """\
 pytest_asyncio_loop_factories must return a non-empty mapping of \
 factory names to callables.
@@ -272,6 +509,98 @@ def _collect_hook_loop_factories(
     return factories
 
 
+class _VirtualTimeSelector:
+    """
+    Selector advancing the clock of a VirtualTimeEventLoop instead of waiting
+    for the next scheduled callback.
+    """
+
+    def __init__(
+        self, selector: selectors.BaseSelector, loop: VirtualTimeEventLoop
+    ) -> None:
+        self._selector = selector
+        self._loop = loop
+
+    def select(
+        self, timeout: float | None = None
+    ) -> list[tuple[selectors.SelectorKey, int]]:
+        events = self._selector.select(0)
+        if events or (timeout is not None and timeout <= 0):
+            return events
+        if timeout is None:
+            # No callbacks are scheduled, so only I/O can wake up the loop.
+            return self._selector.select(None)
+        if self._loop._is_waiting_for_work():
+            # Work outside of the event loop may complete before the next
+            # scheduled callback, so the clock follows the wall clock.
+            start = time.monotonic()
+            events = self._selector.select(timeout)
+            self._loop._advance_time(
+                min(time.monotonic() - start, timeout) if events else timeout
+            )
+            return events
+        self._loop._advance_time(timeout)
+        return events
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._selector, name)
+
+
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    """
+    Event loop with a virtual clock.
+
+    Whenever the loop is idle, the clock jumps ahead to the next scheduled
+    callback. Sleeps and timeouts complete instantly, while callbacks still
+    run in the order of their scheduled time. While file descriptors are
+    registered with the loop or executor jobs are pending, the clock follows
+    the wall clock instead, so that timeouts don't expire before the work
+    outside of the event loop completes.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._virtual_time = 0.0
+        self._pending_executor_jobs = 0
+        selector: selectors.BaseSelector = self._selector  # type: ignore[has-type]
+        # The loop registers its own self-pipe on creation
+        self._self_pipe_fds = frozenset(selector.get_map())
+        self._selector = _VirtualTimeSelector(selector, self)
+
+    def time(self) -> float:
+        return self._virtual_time
+
+    def run_in_executor(  # type: ignore[override]
+        self,
+        executor: concurrent.futures.Executor | None,
+        func: Callable[..., _T],
+        *args: Any,
+    ) -> asyncio.Future[_T]:
+        future = super().run_in_executor(executor, func, *args)
+        self._pending_executor_jobs += 1
+        future.add_done_callback(self._executor_job_done)
+        return future
+
+    def _executor_job_done(self, future: asyncio.Future) -> None:
+        self._pending_executor_jobs -= 1
+
+    def _is_waiting_for_work(self) -> bool:
+        return self._pending_executor_jobs > 0 or any(
+            fd not in self._self_pipe_fds for fd in self._selector.get_map()
+        )
+
+    def _advance_time(self, seconds: float) -> None:
+        self._virtual_time += seconds
+
+    def _reset_time(self) -> None:
+        self._virtual_time = 0.0
+
+
+_BUILTIN_LOOP_FACTORIES: Mapping[str, LoopFactory] = {
+    "virtual_time": VirtualTimeEventLoop,
+}
+
+
 _DEFAULT_FIXTURE_LOOP_SCOPE_UNSET = """\
 The configuration option "asyncio_default_fixture_loop_scope" is unset.
 The event loop scope for asynchronous fixtures will default to the "fixture" caching \
@@ -293,49 +622,325 @@ def _validate_scope(scope: str | None, option_name: str) -> None:
         )
 
 
-def pytest_configure(config: Config) -> None:
+class _Settings(NamedTuple):
+    """The configuration of pytest-asyncio, resolved once per test session."""
+
+    mode: Mode
+    debug: bool
+    loop_stats: bool
+    default_fixture_loop_scope: _ScopeName | None
+    default_test_loop_scope: _ScopeName
+    default_timeout: float | None
+    leaked_tasks_mode: str
+    task_factory_name: str
+    concurrent_fixture_setup: bool
+    concurrent_fixture_teardown: bool
+    function_loop_pool: bool
+    loop_thread: bool
+    propagate_fixture_context: bool
+    shared_executor: bool
+    shared_executor_workers: int | None
+
+
+_settings_key = StashKey[_Settings]()
+
+
+def _resolve_settings(config: Config) -> _Settings:
+    """Parse and validate the command-line options and ini values of the plugin."""
     default_fixture_loop_scope = config.getini("asyncio_default_fixture_loop_scope")
     _validate_scope(default_fixture_loop_scope, "asyncio_default_fixture_loop_scope")
-    if not default_fixture_loop_scope:
-        warnings.warn(PytestDeprecationWarning(_DEFAULT_FIXTURE_LOOP_SCOPE_UNSET))
-
-    default_test_loop_scope = config.getini("asyncio_default_test_loop_scope")
+    default_test_loop_scope = _parse_default_test_loop_scope(config)
     _validate_scope(default_test_loop_scope, "asyncio_default_test_loop_scope")
+    settings = _Settings(
+        mode=_parse_asyncio_mode(config),
+        debug=_parse_asyncio_debug(config),
+        loop_stats=_parse_asyncio_loop_stats(config),
+        default_fixture_loop_scope=default_fixture_loop_scope or None,
+        default_test_loop_scope=default_test_loop_scope,
+        default_timeout=_parse_default_timeout(config),
+        leaked_tasks_mode=_parse_leaked_tasks_mode(config),
+        task_factory_name=_parse_task_factory_name(config),
+        concurrent_fixture_setup=_parse_bool_ini(
+            config, "asyncio_concurrent_fixture_setup"
+        ),
+        concurrent_fixture_teardown=_parse_bool_ini(
+            config, "asyncio_concurrent_fixture_teardown"
+        ),
+        function_loop_pool=_parse_bool_ini(config, "asyncio_function_loop_pool"),
+        loop_thread=_parse_bool_ini(config, "asyncio_loop_thread"),
+        propagate_fixture_context=_parse_bool_ini(
+            config, "asyncio_propagate_fixture_context"
+        ),
+        shared_executor=_parse_bool_ini(config, "asyncio_shared_executor"),
+        shared_executor_workers=_parse_shared_executor_workers(config),
+    )
+    if settings.loop_thread and sys.version_info < (3, 11):
+        raise pytest.UsageError("asyncio_loop_thread requires Python 3.11 or later.")
+    return settings
+
+
+def _get_settings(config: Config) -> _Settings:
+    return config.stash[_settings_key]
+
+
+def pytest_configure(config: Config) -> None:
+    settings = _resolve_settings(config)
+    config.stash[_settings_key] = settings
+    if settings.default_fixture_loop_scope is None:
+        warnings.warn(PytestDeprecationWarning(_DEFAULT_FIXTURE_LOOP_SCOPE_UNSET))
     config.addinivalue_line(
         "markers",
         "asyncio: "
         "mark the test as a coroutine, it will be "
         "run using an asyncio event loop",
     )
+    if settings.loop_stats:
+        config.stash[_loop_stats_key] = []
+        config.stash[_managed_loops_key] = weakref.WeakSet()
+    if settings.function_loop_pool:
+        config.stash[_loop_pool_key] = _LoopPool()
+
+
+def pytest_unconfigure(config: Config) -> None:
+    shared_executor = config.stash.get(_shared_executor_key, None)
+    if shared_executor is not None:
+        shared_executor.shutdown(wait=True)
+        del config.stash[_shared_executor_key]
+    loop_pool = config.stash.get(_loop_pool_key, None)
+    if loop_pool is not None:
+        loop_pool.close()
+        del config.stash[_loop_pool_key]
 
 
 @pytest.hookimpl(tryfirst=True)
 def pytest_report_header(config: Config) -> list[str]:
     """Add asyncio config to pytest header."""
-    mode = _get_asyncio_mode(config)
-    debug = _get_asyncio_debug(config)
-    default_fixture_loop_scope = config.getini("asyncio_default_fixture_loop_scope")
-    default_test_loop_scope = _get_default_test_loop_scope(config)
+    settings = _get_settings(config)
     header = [
-        f"mode={mode}",
-        f"debug={debug}",
-        f"asyncio_default_fixture_loop_scope={default_fixture_loop_scope}",
-        f"asyncio_default_test_loop_scope={default_test_loop_scope}",
+        f"mode={settings.mode}",
+        f"debug={settings.debug}",
+        f"asyncio_default_fixture_loop_scope={settings.default_fixture_loop_scope}",
+        f"asyncio_default_test_loop_scope={settings.default_test_loop_scope}",
     ]
     return [
         "asyncio: " + ", ".join(header),
     ]
 
 
+class _LoopStats:
+    """Event loop statistics gathered while a single test item runs."""
+
+    def __init__(self) -> None:
+        self.callbacks = 0
+        self.longest_callback = 0.0
+        self.blocked_time = 0.0
+        self.max_lag = 0.0
+
+    def add(self, other: _LoopStats) -> None:
+        self.callbacks += other.callbacks
+        self.longest_callback = max(self.longest_callback, other.longest_callback)
+        self.blocked_time += other.blocked_time
+        self.max_lag = max(self.max_lag, other.max_lag)
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "callbacks": self.callbacks,
+            "longest_callback": self.longest_callback,
+            "blocked_time": self.blocked_time,
+            "max_lag": self.max_lag,
+        }
+
+
+_loop_stats_key = StashKey[list[tuple[str, _LoopStats]]]()
+# Event loops created by pytest-asyncio, while loop stats are enabled
+_managed_loops_key = StashKey[weakref.WeakSet[AbstractEventLoop]]()
+_test_loop_stats_key = StashKey[_LoopStats]()
+# Maps the loops observed for the running test to the stats they replaced
+_test_observed_loops_key = StashKey[dict[AbstractEventLoop, _LoopStats | None]]()
+# Handle._run is only instrumented while at least one loop is observed
+_observed_loops: dict[AbstractEventLoop, _LoopStats] = {}
+_uninstrumented_handle_run = asyncio.Handle._run  # type: ignore[attr-defined]
+
+
+def _instrumented_handle_run(handle: asyncio.Handle) -> None:
+    """
+    Run the callback of an asyncio handle and record its duration.
+
+    The lag of a timer callback is the time between the scheduled time and the
+    time the callback actually ran. A callback counts as blocking the loop when
+    it takes longer than the loop's slow_callback_duration.
+    """
+    loop = handle._loop  # type: ignore[attr-defined]
+    stats = _observed_loops.get(loop)
+    if stats is None:
+        return _uninstrumented_handle_run(handle)
+    if isinstance(handle, asyncio.TimerHandle):
+        stats.max_lag = max(stats.max_lag, loop.time() - handle.when())
+    stats.callbacks += 1
+    start = time.perf_counter()
+    try:
+        return _uninstrumented_handle_run(handle)
+    finally:
+        duration = time.perf_counter() - start
+        stats.longest_callback = max(stats.longest_callback, duration)
+        if duration >= loop.slow_callback_duration:
+            stats.blocked_time += duration
+
+
+def _observe_loop(loop: AbstractEventLoop, stats: _LoopStats) -> _LoopStats | None:
+    """
+    Record the callbacks of the loop in the specified stats.
+
+    Returns the stats that previously recorded the callbacks of the loop.
+    """
+    global _uninstrumented_handle_run
+    if not _observed_loops:
+        _uninstrumented_handle_run = asyncio.Handle._run  # type: ignore[attr-defined]
+        asyncio.Handle._run = _instrumented_handle_run  # type: ignore[method-assign, assignment]
+    previous_stats = _observed_loops.get(loop)
+    _observed_loops[loop] = stats
+    return previous_stats
+
+
+def _stop_observing_loop(
+    loop: AbstractEventLoop, previous_stats: _LoopStats | None
+) -> None:
+    """Restore the stats that recorded the callbacks of the loop before."""
+    if previous_stats is None:
+        _observed_loops.pop(loop, None)
+    else:
+        _observed_loops[loop] = previous_stats
+    if not _observed_loops:
+        asyncio.Handle._run = _uninstrumented_handle_run  # type: ignore[method-assign]
+
+
+@contextlib.contextmanager
+def _collect_loop_stats() -> Iterator[_LoopStats]:
+    """
+    Collect statistics of the running event loop within the context.
+
+    The statistics are added to the statistics of the running test, if any.
+    """
+    loop = asyncio.get_running_loop()
+    stats = _LoopStats()
+    previous_stats = _observe_loop(loop, stats)
+    try:
+        yield stats
+    finally:
+        _stop_observing_loop(loop, previous_stats)
+        if previous_stats is not None:
+            previous_stats.add(stats)
+
+
+def _observe_test_loop(config: Config, loop: AbstractEventLoop) -> None:
+    """Record the callbacks of the loop in the stats of the running test."""
+    observed_loops = config.stash.get(_test_observed_loops_key, None)
+    if observed_loops is None or loop in observed_loops:
+        return
+    observed_loops[loop] = _observe_loop(loop, config.stash[_test_loop_stats_key])
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_setup(item: Item) -> Generator[None]:
+    config = item.config
+    managed_loops = config.stash.get(_managed_loops_key, None)
+    if managed_loops is not None:
+        config.stash[_test_loop_stats_key] = _LoopStats()
+        config.stash[_test_observed_loops_key] = {}
+        # Loops with a wider scope were created before the test
+        for loop in list(managed_loops):
+            if not loop.is_closed():
+                _observe_test_loop(config, loop)
+    return (yield)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_teardown(item: Item) -> Generator[None]:
+    config = item.config
+    try:
+        try:
+            return (yield)
+        finally:
+            _run_deferred_finalizers(config)
+    finally:
+        observed_loops = config.stash.get(_test_observed_loops_key, None)
+        if observed_loops is not None:
+            del config.stash[_test_observed_loops_key]
+            for loop, previous_stats in observed_loops.items():
+                _stop_observing_loop(loop, previous_stats)
+            stats = config.stash[_test_loop_stats_key]
+            del config.stash[_test_loop_stats_key]
+            if stats.callbacks:
+                config.stash[_loop_stats_key].append((item.nodeid, stats))
+                item.user_properties.append(("asyncio_loop_stats", stats.as_dict()))
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter) -> None:
+    _report_loop_stats(terminalreporter)
+    _report_async_benchmarks(terminalreporter)
+
+
+def _report_loop_stats(terminalreporter: pytest.TerminalReporter) -> None:
+    loop_stats = terminalreporter.config.stash.get(_loop_stats_key, None)
+    if not loop_stats:
+        return
+    terminalreporter.write_sep("=", "asyncio event loop stats (slowest 10)")
+    slowest = sorted(
+        loop_stats,
+        key=lambda entry: (entry[1].blocked_time, entry[1].longest_callback),
+        reverse=True,
+    )
+    for nodeid, stats in slowest[:10]:
+        terminalreporter.write_line(
+            f"{stats.blocked_time:.3f}s blocked "
+            f"{stats.longest_callback:.3f}s longest callback "
+            f"{stats.max_lag:.3f}s max lag "
+            f"{stats.callbacks} callbacks "
+            f"{nodeid}"
+        )
+
+
+def _report_async_benchmarks(terminalreporter: pytest.TerminalReporter) -> None:
+    benchmarks = terminalreporter.config.stash.get(_async_benchmarks_key, None)
+    if not benchmarks:
+        return
+    terminalreporter.write_sep("=", "asyncio benchmarks")
+    for nodeid, stats in benchmarks:
+        terminalreporter.write_line(
+            f"{stats['min'] * 1e6:.2f}us min "
+            f"{stats['median'] * 1e6:.2f}us median "
+            f"{stats['stddev'] * 1e6:.2f}us stddev "
+            f"{stats['rounds']} rounds "
+            f"{stats['iterations']} iterations "
+            f"{stats['callbacks_per_iteration']:.1f} callbacks/iteration "
+            f"{nodeid}"
+        )
+
+
 def _fixture_synchronizer(
     fixturedef: FixtureDef, runner: Runner, request: FixtureRequest
 ) -> Callable:
     """Returns a synchronous function evaluating the specified fixture."""
     fixture_function = resolve_fixture_function(fixturedef, request)
+    prefetched_fixtures = request._pyfuncitem.stash.get(_prefetched_fixtures_key, {})
+    prefetched = prefetched_fixtures.pop(fixturedef, None)
+    propagate_context = _get_fixture_propagate_context(fixturedef, request.config)
     if inspect.isasyncgenfunction(fixturedef.func):
-        return _wrap_asyncgen_fixture(fixture_function, runner, request)  # type: ignore[arg-type]
+        return _wrap_asyncgen_fixture(
+            fixture_function,  # type: ignore[arg-type]
+            runner,
+            request,
+            prefetched,
+            propagate_context=propagate_context,
+        )
     elif inspect.iscoroutinefunction(fixturedef.func):
-        return _wrap_async_fixture(fixture_function, runner, request)  # type: ignore[arg-type]
+        return _wrap_async_fixture(
+            fixture_function,  # type: ignore[arg-type]
+            runner,
+            request,
+            prefetched,
+            propagate_context=propagate_context,
+        )
     elif inspect.isgeneratorfunction(fixturedef.func):
         return _wrap_syncgen_fixture(fixture_function, runner)  # type: ignore[arg-type]
     else:
@@ -357,8 +962,23 @@ def _wrap_syncgen_fixture(
         *args: SyncGenFixtureParams.args,
         **kwargs: SyncGenFixtureParams.kwargs,
     ) -> Generator[SyncGenFixtureYieldType]:
-        with _temporary_event_loop(runner.get_loop()):
-            yield from fixture_function(*args, **kwargs)
+        policy = _LazyEventLoopPolicy(_get_event_loop_policy(), runner)
+        # The policy is only installed while the fixture code runs, so it
+        # doesn't replace the policy seen by the tests.
+        with _temporary_event_loop_policy(policy):
+            gen = fixture_function(*args, **kwargs)
+        try:
+            while True:
+                with _temporary_event_loop_policy(policy):
+                    try:
+                        value = next(gen)
+                    except StopIteration:
+                        return
+                yield value
+        finally:
+            with _temporary_event_loop_policy(policy):
+                gen.close()
+            policy.restore()
 
     return _syncgen_fixture_wrapper
 
@@ -376,8 +996,12 @@ def _wrap_sync_fixture(
         *args: SyncFixtureParams.args,
         **kwargs: SyncFixtureParams.kwargs,
     ) -> SyncFixtureReturnType:
-        with _temporary_event_loop(runner.get_loop()):
-            return fixture_function(*args, **kwargs)
+        policy = _LazyEventLoopPolicy(_get_event_loop_policy(), runner)
+        try:
+            with _temporary_event_loop_policy(policy):
+                return fixture_function(*args, **kwargs)
+        finally:
+            policy.restore()
 
     return _sync_fixture_wrapper
 
@@ -392,22 +1016,36 @@ def _wrap_asyncgen_fixture(
     ],
     runner: Runner,
     request: FixtureRequest,
+    prefetched: _PrefetchedFixture | None = None,
+    *,
+    propagate_context: bool = True,
 ) -> Callable[AsyncGenFixtureParams, AsyncGenFixtureYieldType]:
     @functools.wraps(fixture_function)
     def _asyncgen_fixture_wrapper(
         *args: AsyncGenFixtureParams.args,
         **kwargs: AsyncGenFixtureParams.kwargs,
     ):
-        gen_obj = fixture_function(*args, **kwargs)
+        if prefetched is not None:
+            assert prefetched.gen_obj is not None
+            gen_obj = prefetched.gen_obj
+            context = prefetched.context
+            result = runner.run(prefetched.result(), context=context)
+        else:
+            gen_obj = fixture_function(*args, **kwargs)
 
-        async def setup():
-            res = await gen_obj.__anext__()
-            return res
+            async def setup():
+                res = await gen_obj.__anext__()
+                return res
 
-        context = contextvars.copy_context()
-        result = runner.run(setup(), context=context)
+            context = _fixture_context(request.config, runner, propagate_context)
+            result = runner.run(setup(), context=context)
 
-        reset_contextvars = _apply_contextvar_changes(context)
+        reset_contextvars = (
+            _apply_contextvar_changes(context) if propagate_context else None
+        )
+        dependencies = None
+        if _get_settings(request.config).concurrent_fixture_teardown:
+            dependencies = _get_deferrable_fixture_dependencies(request)
 
         def finalizer() -> None:
             """Yield again, to finalize."""
@@ -422,6 +1060,14 @@ def _wrap_asyncgen_fixture(
                     msg += "Yield only once."
                     raise ValueError(msg)
 
+            if dependencies is not None:
+                _defer_async_finalizer(
+                    request.config,
+                    runner,
+                    _DeferredFinalizer(async_finalizer, context, reset_contextvars),
+                    dependencies,
+                )
+                return
             runner.run(async_finalizer(), context=context)
             if reset_contextvars is not None:
                 reset_contextvars()
@@ -442,18 +1088,29 @@ def _wrap_async_fixture(
     ],
     runner: Runner,
     request: FixtureRequest,
+    prefetched: _PrefetchedFixture | None = None,
+    *,
+    propagate_context: bool = True,
 ) -> Callable[AsyncFixtureParams, AsyncFixtureReturnType]:
     @functools.wraps(fixture_function)
     def _async_fixture_wrapper(
         *args: AsyncFixtureParams.args,
         **kwargs: AsyncFixtureParams.kwargs,
     ):
-        async def setup():
-            res = await fixture_function(*args, **kwargs)
-            return res
+        if prefetched is not None:
+            context = prefetched.context
+            result = runner.run(prefetched.result(), context=context)
+        else:
 
-        context = contextvars.copy_context()
-        result = runner.run(setup(), context=context)
+            async def setup():
+                res = await fixture_function(*args, **kwargs)
+                return res
+
+            context = _fixture_context(request.config, runner, propagate_context)
+            result = runner.run(setup(), context=context)
+
+        if not propagate_context:
+            return result
 
         # Copy the context vars modified by the setup task into the current
         # context, and (if needed) add a finalizer to reset them.
@@ -472,6 +1129,144 @@ def _wrap_async_fixture(
     return _async_fixture_wrapper
 
 
+class _DeferredFinalizer:
+    """The teardown of an async generator fixture waiting to be run in a batch."""
+
+    def __init__(
+        self,
+        finalizer: Callable[[], Awaitable[None]],
+        context: contextvars.Context,
+        reset_contextvars: Callable[[], None] | None,
+    ) -> None:
+        self.finalizer = finalizer
+        self.context = context
+        self.reset_contextvars = reset_contextvars
+
+
+_deferred_finalizers_key = StashKey[dict[Runner, list[_DeferredFinalizer]]]()
+# The fixtures whose teardown runs the batch of deferred finalizers of a runner
+_registered_batches_key = StashKey[set[tuple[FixtureDef, Runner]]]()
+
+
+def _get_deferrable_fixture_dependencies(
+    request: FixtureRequest,
+) -> list[FixtureDef] | None:
+    """
+    Returns the fixtures the requesting fixture depends on.
+
+    Returns None, if the fixture can request arbitrary fixtures dynamically, in
+    which case its teardown cannot be deferred safely.
+    """
+    fixturedef: FixtureDef = request._fixturedef  # type: ignore[attr-defined]
+    if "request" in fixturedef.argnames:
+        return None
+    return [request._get_active_fixturedef(arg) for arg in fixturedef.argnames]
+
+
+def _defer_async_finalizer(
+    config: Config,
+    runner: Runner,
+    finalizer: _DeferredFinalizer,
+    dependencies: Iterable[FixtureDef],
+) -> None:
+    """
+    Add the finalizer to the batch of pending finalizers of the runner.
+
+    The batch is run before any of the fixtures the finalizer depends on is
+    torn down, before the runner itself is torn down and at the end of the
+    teardown of each test, whichever comes first.
+    """
+    deferred_finalizers = config.stash.setdefault(_deferred_finalizers_key, {})
+    deferred_finalizers.setdefault(runner, []).append(finalizer)
+    registered_batches = config.stash.setdefault(_registered_batches_key, set())
+    for fixturedef in dependencies:
+        if (fixturedef, runner) in registered_batches:
+            continue
+        registered_batches.add((fixturedef, runner))
+        # Finalizers run in reverse order of registration, so the batch runs
+        # before the fixture's own teardown.
+        fixturedef.addfinalizer(
+            functools.partial(_run_registered_batch, config, runner, fixturedef)
+        )
+
+
+def _run_registered_batch(
+    config: Config, runner: Runner, fixturedef: FixtureDef
+) -> None:
+    """
+    Run the pending finalizers of the runner as the fixture is torn down.
+
+    Finalizers deferred afterwards register the batch with the fixture again.
+    """
+    config.stash[_registered_batches_key].discard((fixturedef, runner))
+    _run_deferred_finalizers(config, runner)
+
+
+def _run_deferred_finalizers(config: Config, runner: Runner | None = None) -> None:
+    """
+    Run the pending finalizers of the runner concurrently.
+
+    If no runner is given, the pending finalizers of all runners are run.
+    Errors raised by multiple finalizers are aggregated into an ExceptionGroup.
+    """
+    deferred_finalizers = config.stash.get(_deferred_finalizers_key, None)
+    if not deferred_finalizers:
+        return
+    runners = list(deferred_finalizers) if runner is None else [runner]
+    exceptions: list[BaseException] = []
+    for runner in runners:
+        finalizers = deferred_finalizers.pop(runner, None)
+        if not finalizers:
+            continue
+
+        async def run_finalizers(finalizers: list[_DeferredFinalizer]) -> list[Any]:
+            tasks = [
+                finalizer.context.run(asyncio.ensure_future, finalizer.finalizer())
+                for finalizer in finalizers
+            ]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            results = runner.run(run_finalizers(finalizers))
+        finally:
+            for finalizer in finalizers:
+                if finalizer.reset_contextvars is not None:
+                    finalizer.reset_contextvars()
+        exceptions.extend(
+            result for result in results if isinstance(result, BaseException)
+        )
+    if len(exceptions) == 1:
+        raise exceptions[0]
+    elif exceptions:
+        raise BaseExceptionGroup(
+            "errors while tearing down async generator fixtures", exceptions
+        )
+
+
+# The context shared by the fixtures of a runner that don't propagate their context
+_runner_contexts_key = StashKey[
+    weakref.WeakKeyDictionary[Runner, contextvars.Context]
+]()
+
+
+def _fixture_context(
+    config: Config, runner: Runner, propagate_context: bool
+) -> contextvars.Context:
+    """
+    Return the context to run an async fixture in.
+
+    Fixtures that propagate their contextvar changes run in a copy of the current
+    context. All other fixtures run in a context that is shared by the fixtures of
+    the same runner, which spares copying and comparing the current context.
+    """
+    if propagate_context:
+        return contextvars.copy_context()
+    return config.stash[_runner_contexts_key][runner]
+
+
+_UNSET = object()
+
+
 def _apply_contextvar_changes(
     context: contextvars.Context,
 ) -> Callable[[], None] | None:
@@ -481,18 +1276,16 @@ def _apply_contextvar_changes(
     If any contextvars were modified by the fixture, return a finalizer that
     will restore them.
     """
-    context_tokens = []
-    for var in context:
-        try:
-            if var.get() is context.get(var):
-                # This variable is not modified, so leave it as-is.
-                continue
-        except LookupError:
-            # This variable isn't yet set in the current context at all.
-            pass
-        token = var.set(context.get(var))
-        context_tokens.append((var, token))
-
+    current_context = contextvars.copy_context()
+    # A copied context shares its mapping with the original until a variable
+    # is set in either of them. Comparing two contexts with the same mapping
+    # is an identity check that doesn't look at the variables, so fixtures that
+    # leave the context alone don't pay for the number of variables in it.
+    # Otherwise, the comparison stops at the first difference, or right away
+    # if the fixture set a new variable.
+    if context == current_context:
+        return None
+    context_tokens = _set_changed_contextvars(context, current_context)
     if not context_tokens:
         return None
 
@@ -504,8 +1297,179 @@ def _apply_contextvar_changes(
     return restore_contextvars
 
 
-class PytestAsyncioFunction(Function):
-    """Base class for all test functions managed by pytest-asyncio."""
+def _set_changed_contextvars(
+    context: contextvars.Context, current_context: contextvars.Context
+) -> list[tuple[contextvars.ContextVar, contextvars.Token]]:
+    """
+    Set the contextvars whose value in context differs from current_context.
+
+    Return the variables and the tokens to reset them.
+    """
+    variables = list(context.keys())
+    # Compare the values by identity without a Python-level call per variable,
+    # so that applications with many contextvars only pay for a C-level scan
+    # of the context. The keys and values of a context are iterated in the
+    # same order.
+    changed_variables = itertools.compress(
+        variables,
+        map(
+            operator.is_not,
+            context.values(),
+            map(current_context.get, variables, itertools.repeat(_UNSET)),
+        ),
+    )
+    return [(var, var.set(context[var])) for var in changed_variables]
+
+
+class _PrefetchedFixture:
+    """The setup of an async fixture that was started ahead of time."""
+
+    def __init__(
+        self,
+        task: asyncio.Task,
+        runner: Runner,
+        context: contextvars.Context,
+        gen_obj: AsyncGeneratorType | None = None,
+    ) -> None:
+        self.task = task
+        self.runner = runner
+        self.context = context
+        self.gen_obj = gen_obj
+
+    async def result(self) -> Any:
+        return await self.task
+
+
+_prefetched_fixtures_key = StashKey[dict[FixtureDef, _PrefetchedFixture]]()
+
+
+def _prefetch_async_fixtures(item: PytestAsyncioFunction) -> None:
+    """
+    Start the setup of independent async fixtures of the item as concurrent tasks.
+
+    Async fixtures that don't request other async fixtures are started in their
+    event loop before pytest sets up the fixtures of the item. The tasks make
+    progress whenever the loop runs, so their setup overlaps. Pytest still sets
+    up each fixture in its usual order, but the fixture wrapper awaits the
+    existing task instead of calling the fixture function again.
+
+    Only fixtures whose arguments are already cached are started, so that no
+    other fixture is set up out of order. Fixtures depending on another async
+    fixture, directly or through sync fixtures, aren't started either.
+    Parametrized fixtures, fixtures using the "request" fixture and fixtures
+    that are already cached are set up sequentially, as usual.
+    """
+    config = item.config
+    name2fixturedefs = item._fixtureinfo.name2fixturedefs
+    async_fixturedefs: dict[str, FixtureDef] = {}
+    for name in item.fixturenames:
+        fixturedefs = name2fixturedefs.get(name)
+        if not fixturedefs:
+            continue
+        fixturedef = fixturedefs[-1]
+        if (
+            fixturedef.cached_result is None
+            and _is_asyncio_fixture(fixturedef, config)
+            and _is_coroutine_or_asyncgen(fixturedef.func)
+        ):
+            async_fixturedefs[name] = fixturedef
+    candidates: dict[_ScopeName, list[FixtureDef]] = {}
+    for name, fixturedef in async_fixturedefs.items():
+        if (
+            fixturedef.params is not None
+            or "request" in fixturedef.argnames
+            or name in fixturedef.argnames
+            or any(
+                name2fixturedefs[arg][-1].cached_result is None
+                or name2fixturedefs[arg][-1]._scope < fixturedef._scope
+                for arg in fixturedef.argnames
+                if arg in name2fixturedefs
+            )
+            or not _fixture_closure(fixturedef, name2fixturedefs).isdisjoint(
+                async_fixturedefs
+            )
+        ):
+            continue
+        loop_scope = _get_fixture_loop_scope(fixturedef, config)
+        candidates.setdefault(loop_scope, []).append(fixturedef)
+
+    prefetched_fixtures = item.stash.setdefault(_prefetched_fixtures_key, {})
+    for loop_scope, fixturedefs in candidates.items():
+        if len(fixturedefs) < 2:
+            continue
+        runner = item._request.getfixturevalue(f"_{loop_scope}_scoped_runner")
+        loop = runner.get_loop()
+        for fixturedef in fixturedefs:
+            # The runner requests user-overridable fixtures, such as the
+            # event loop policy, which may have set up the fixture already.
+            if fixturedef.cached_result is not None:
+                continue
+            kwargs = {
+                arg: item._request.getfixturevalue(arg) for arg in fixturedef.argnames
+            }
+            fixture_function: Callable[..., Any] = resolve_fixture_function(
+                fixturedef, item._request
+            )
+            context = _fixture_context(
+                config, runner, _get_fixture_propagate_context(fixturedef, config)
+            )
+            gen_obj = None
+            if inspect.isasyncgenfunction(fixturedef.func):
+                gen_obj = fixture_function(**kwargs)
+                coro = gen_obj.__anext__()
+            else:
+                coro = fixture_function(**kwargs)
+            create_task = functools.partial(
+                loop.create_task,
+                coro,
+                context=context,  # type: ignore[call-arg]
+            )
+            if isinstance(runner, _ThreadedRunner):
+                # Tasks must be created on the thread of the event loop
+                task = runner.call(create_task)
+            else:
+                task = create_task()
+            prefetched_fixtures[fixturedef] = _PrefetchedFixture(
+                task, runner, context, gen_obj
+            )
+
+
+def _fixture_closure(
+    fixturedef: FixtureDef, name2fixturedefs: Mapping[str, Sequence[FixtureDef]]
+) -> set[str]:
+    """Returns the names of the fixtures that the fixture depends on transitively."""
+    closure: set[str] = set()
+    pending = list(fixturedef.argnames)
+    while pending:
+        name = pending.pop()
+        if name in closure or name not in name2fixturedefs:
+            continue
+        closure.add(name)
+        pending.extend(name2fixturedefs[name][-1].argnames)
+    return closure
+
+
+def _cancel_prefetched_fixtures(item: PytestAsyncioFunction) -> None:
+    """Cancel fixture setups that were started, but never used by pytest."""
+    prefetched_fixtures = item.stash.get(_prefetched_fixtures_key, None)
+    if not prefetched_fixtures:
+        return
+    del item.stash[_prefetched_fixtures_key]
+
+    async def cancel(tasks: Collection[asyncio.Task]) -> None:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    tasks_by_runner: dict[Runner, list[asyncio.Task]] = {}
+    for prefetched in prefetched_fixtures.values():
+        tasks_by_runner.setdefault(prefetched.runner, []).append(prefetched.task)
+    for runner, tasks in tasks_by_runner.items():
+        runner.run(cancel(tasks))
+
+
+class PytestAsyncioFunction(Function):
+    """Base class for all test functions managed by pytest-asyncio."""
 
     @classmethod
     def item_subclass_for(cls, item: Function, /) -> type[PytestAsyncioFunction] | None:
@@ -523,10 +1487,18 @@ class PytestAsyncioFunction(Function):
     @classmethod
     def _from_function(cls, function: Function, /) -> Function:
         """
-        Instantiates this specific PytestAsyncioFunction type from the specified
-        Function item.
+        Turns the specified Function item into this specific PytestAsyncioFunction
+        type.
+
+        Plain Function items are converted in place, because PytestAsyncioFunction
+        doesn't add any state to Function. This avoids constructing every async
+        item twice. Items of Function subclasses, e.g. from other plugins, may
+        carry state of their own, so a new item is instantiated for them.
         """
         assert function.get_closest_marker("asyncio")
+        if type(function) is Function:
+            function.__class__ = cls
+            return function
         assert function.parent is not None
         subclass_instance = cls.from_parent(
             function.parent,
@@ -556,18 +1528,60 @@ class PytestAsyncioFunction(Function):
         hook_caller = self.config.hook.pytest_asyncio_loop_factories
         if hook_caller.get_hookimpls():
             _ = self._request.getfixturevalue(_asyncio_loop_factory.__name__)
-        return super().setup()
+        # Passing a context to create_task requires Python 3.11
+        if (
+            sys.version_info >= (3, 11)
+            and _get_settings(self.config).concurrent_fixture_setup
+        ):
+            _prefetch_async_fixtures(self)
+        try:
+            return super().setup()
+        finally:
+            _cancel_prefetched_fixtures(self)
 
     def runtest(self) -> None:
         runner_fixture_id = f"_{self._loop_scope}_scoped_runner"
         runner = self._request.getfixturevalue(runner_fixture_id)
         context = contextvars.copy_context()
         synchronized_obj = _synchronize_coroutine(
-            getattr(*self._synchronization_target_attr), runner, context
+            getattr(*self._synchronization_target_attr),
+            runner,
+            context,
+            self._timeout,
         )
+        if self._shared_executor is True:
+            _install_shared_executor(runner.get_loop(), self.config)
+        elif self._shared_executor is False:
+            _detach_shared_executor(runner.get_loop(), self.config)
+        leaked_tasks_mode = _get_settings(self.config).leaked_tasks_mode
+        # Tasks on a loop thread are meant to keep running in between tests.
+        check_leaked_tasks = (
+            not isinstance(runner, _ThreadedRunner) and leaked_tasks_mode != "ignore"
+        )
+        if check_leaked_tasks:
+            tasks_before = asyncio.all_tasks(runner.get_loop())
         with MonkeyPatch.context() as c:
             c.setattr(*self._synchronization_target_attr, synchronized_obj)
-            super().runtest()
+            with _overriding_task_factory(runner.get_loop(), self._task_factory):
+                super().runtest()
+        if check_leaked_tasks:
+            leaked_tasks = asyncio.all_tasks(runner.get_loop()) - tasks_before
+            if leaked_tasks:
+                self._record_leaked_tasks(leaked_tasks_mode, leaked_tasks)
+
+    def _record_leaked_tasks(self, mode: str, leaked_tasks: set[asyncio.Task]) -> None:
+        leaked_task_origins = self.config.stash.setdefault(
+            _leaked_task_origins_key, weakref.WeakKeyDictionary()
+        )
+        for task in leaked_tasks:
+            leaked_task_origins[task] = self.nodeid
+        self.user_properties.append(("asyncio_leaked_tasks", len(leaked_tasks)))
+        report = _format_leaked_tasks_report(
+            f"{len(leaked_tasks)} task(s) created by {self.nodeid} "
+            "are still pending after the test finished",
+            leaked_tasks,
+        )
+        _report_leaked_tasks(mode, report)
 
     @functools.cached_property
     def _loop_scope(self) -> _ScopeName:
@@ -581,13 +1595,54 @@ class PytestAsyncioFunction(Function):
         """
         marker = self.get_closest_marker("asyncio")
         assert marker is not None
-        default_loop_scope = _get_default_test_loop_scope(self.config)
+        default_loop_scope = _get_settings(self.config).default_test_loop_scope
         loop_scope = marker.kwargs.get("loop_scope") or marker.kwargs.get("scope")
         if loop_scope is None:
             return default_loop_scope
         else:
             return loop_scope
 
+    @functools.cached_property
+    def _timeout(self) -> float | None:
+        """
+        Return the number of seconds after which the test coroutine is cancelled.
+
+        The value of the `timeout` keyword argument of the closest `asyncio`
+        marker takes precedence over the `asyncio_default_timeout` configuration
+        value. None means that the test may run indefinitely.
+        """
+        marker = self.get_closest_marker("asyncio")
+        assert marker is not None
+        if "timeout" in marker.kwargs:
+            return marker.kwargs["timeout"] or None
+        return _get_settings(self.config).default_timeout
+
+    @functools.cached_property
+    def _shared_executor(self) -> bool | None:
+        """
+        Return whether the test overrides the use of the shared default executor.
+
+        The value is taken from the `shared_executor` keyword argument of the
+        closest `asyncio` marker. None means that the `asyncio_shared_executor`
+        configuration value applies.
+        """
+        marker = self.get_closest_marker("asyncio")
+        assert marker is not None
+        return marker.kwargs.get("shared_executor")
+
+    @functools.cached_property
+    def _task_factory(self) -> str | None:
+        """
+        Return the name of the task factory the test coroutine runs with.
+
+        The value is taken from the `task_factory` keyword argument of the
+        closest `asyncio` marker. None means that the task factory configured
+        by `asyncio_task_factory` applies.
+        """
+        marker = self.get_closest_marker("asyncio")
+        assert marker is not None
+        return marker.kwargs.get("task_factory")
+
     @property
     def _synchronization_target_attr(self) -> tuple[object, str]:
         """
@@ -679,7 +1734,7 @@ def _resolve_asyncio_marker(item: Function) -> Mark | None:
     marker = item.get_closest_marker("asyncio")
     if marker is not None:
         return marker
-    if _get_asyncio_mode(item.config) == Mode.AUTO:
+    if _get_settings(item.config).mode == Mode.AUTO:
         item.add_marker("asyncio")
         return item.get_closest_marker("asyncio")
     return None
@@ -720,6 +1775,10 @@ def pytest_pycollect_makeitem_convert_async_functions_to_subclass(
                 and _resolve_asyncio_marker(node) is not None
             ):
                 updated_item = specialized_item_class._from_function(node)
+                if _get_settings(node.config).mode == Mode.STRICT:
+                    updated_item.stash[_unmarked_async_fixtures_key] = (
+                        _unmarked_async_fixtures(updated_item)
+                    )
         updated_node_collection.append(updated_item)
     hook_result.force_result(updated_node_collection)
 
@@ -741,33 +1800,41 @@ def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
 
     hook_factories = _collect_hook_loop_factories(metafunc.config, metafunc.definition)
     if hook_factories is None:
-        if marker_selected_factory_names is not None:
+        if marker_selected_factory_names is None:
+            return
+        if any(
+            name not in _BUILTIN_LOOP_FACTORIES
+            for name in marker_selected_factory_names
+        ):
             raise pytest.UsageError(
                 "mark.asyncio 'loop_factories' requires at least one "
                 "pytest_asyncio_loop_factories hook implementation."
             )
-        return
 
     factory_params: Collection[object]
     factory_ids: Collection[str]
     if marker_selected_factory_names is None:
+        assert hook_factories is not None
         factory_params = hook_factories.values()
         factory_ids = hook_factories.keys()
     else:
+        # Built-in factories can only be selected explicitly. Factories
+        # returned by the hook take precedence over built-in factories.
+        available_factories = {**_BUILTIN_LOOP_FACTORIES, **(hook_factories or {})}
         # Iterate in marker order to preserve explicit user selection
         # order.
         factory_ids = marker_selected_factory_names
         factory_params = [
             (
-                hook_factories[name]
-                if name in hook_factories
+                available_factories[name]
+                if name in available_factories
                 else pytest.param(
                     None,
                     marks=pytest.mark.skip(
                         reason=(
                             f"Loop factory {name!r} is not available."
                             f" Available factories:"
-                            f" {', '.join(hook_factories)}."
+                            f" {', '.join(available_factories)}."
                         ),
                     ),
                 )
@@ -775,7 +1842,7 @@ def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
             for name in marker_selected_factory_names
         ]
     metafunc.fixturenames.append(_asyncio_loop_factory.__name__)
-    default_loop_scope = _get_default_test_loop_scope(metafunc.config)
+    default_loop_scope = _get_settings(metafunc.config).default_test_loop_scope
     loop_scope = marker_loop_scope or default_loop_scope
     # pytest.HIDDEN_PARAM was added in pytest 8.4
     hide_id = len(factory_ids) == 1 and hasattr(pytest, "HIDDEN_PARAM")
@@ -788,20 +1855,63 @@ def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
     )
 
 
-@contextlib.contextmanager
-def _temporary_event_loop(loop: AbstractEventLoop) -> Iterator[None]:
-    try:
-        old_loop = _get_event_loop_no_warn()
-    except RuntimeError:
-        old_loop = None
-    if old_loop is loop:
-        yield
-        return
-    _set_event_loop(loop)
-    try:
-        yield
-    finally:
-        _set_event_loop(old_loop)
+with warnings.catch_warnings():
+    # AbstractEventLoopPolicy is deprecated since Python 3.14
+    warnings.simplefilter("ignore", DeprecationWarning)
+    _AbstractEventLoopPolicy = asyncio.AbstractEventLoopPolicy
+
+
+class _LazyEventLoopPolicy(_AbstractEventLoopPolicy):  # type: ignore[misc,valid-type]
+    """
+    Event loop policy whose current event loop is the loop of a runner.
+
+    The runner only creates its loop when the current event loop is requested,
+    so sync fixtures that never touch asyncio don't create one. All other
+    calls are delegated to the wrapped policy.
+    """
+
+    def __init__(self, policy: AbstractEventLoopPolicy, runner: Runner) -> None:
+        self._policy = policy
+        self._runner = runner
+        self._saved_loop: AbstractEventLoop | None = None
+        self._has_saved_loop = False
+
+    def _save_loop(self) -> None:
+        if self._has_saved_loop:
+            return
+        try:
+            self._saved_loop = _get_event_loop_no_warn(self._policy)
+        except RuntimeError:
+            self._saved_loop = None
+        self._has_saved_loop = True
+
+    def get_event_loop(self) -> AbstractEventLoop:
+        if not self._has_saved_loop:
+            self._save_loop()
+            self._policy.set_event_loop(self._runner.get_loop())
+        return self._policy.get_event_loop()
+
+    def set_event_loop(self, loop: AbstractEventLoop | None) -> None:
+        self._save_loop()
+        self._policy.set_event_loop(loop)
+
+    def new_event_loop(self) -> AbstractEventLoop:
+        return self._policy.new_event_loop()
+
+    if sys.version_info < (3, 14):
+
+        def get_child_watcher(self) -> Any:
+            return self._policy.get_child_watcher()  # type: ignore[attr-defined]
+
+        def set_child_watcher(self, watcher: Any) -> None:
+            self._policy.set_child_watcher(watcher)  # type: ignore[attr-defined]
+
+    def restore(self) -> None:
+        """Reinstate the event loop that was current before the first access."""
+        if self._has_saved_loop:
+            self._policy.set_event_loop(self._saved_loop)
+            self._saved_loop = None
+            self._has_saved_loop = False
 
 
 @contextlib.contextmanager
@@ -850,31 +1960,22 @@ def pytest_pyfunc_call(pyfuncitem: Function) -> object | None:
     """Pytest hook called before a test case is run."""
     if pyfuncitem.get_closest_marker("asyncio") is not None:
         if is_async_test(pyfuncitem):
-            asyncio_mode = _get_asyncio_mode(pyfuncitem.config)
-            for fixname, fixtures in pyfuncitem._fixtureinfo.name2fixturedefs.items():
-                # name2fixturedefs is a dict between fixture name and a list of matching
-                # fixturedefs. The last entry in the list is closest and the one used.
-                func = fixtures[-1].func
-                if (
-                    asyncio_mode == Mode.STRICT
-                    and _is_coroutine_or_asyncgen(func)
-                    and not _is_asyncio_fixture_function(func)
-                ):
-                    warnings.warn(
-                        PytestDeprecationWarning(
-                            f"asyncio test {pyfuncitem.name!r} requested async "
-                            "@pytest.fixture "
-                            f"{fixname!r} in strict mode. "
-                            "You might want to use @pytest_asyncio.fixture or switch "
-                            "to auto mode. "
-                            "This will become an error in future versions of "
-                            "pytest-asyncio."
-                        ),
-                        stacklevel=1,
-                    )
-                    # no stacklevel points at the users code, so we set stacklevel=1
-                    # so it at least indicates that it's the plugin complaining.
-                    # Pytest gives the test file & name in the warnings summary at least
+            for fixname in pyfuncitem.stash.get(_unmarked_async_fixtures_key, ()):
+                warnings.warn(
+                    PytestDeprecationWarning(
+                        f"asyncio test {pyfuncitem.name!r} requested async "
+                        "@pytest.fixture "
+                        f"{fixname!r} in strict mode. "
+                        "You might want to use @pytest_asyncio.fixture or switch "
+                        "to auto mode. "
+                        "This will become an error in future versions of "
+                        "pytest-asyncio."
+                    ),
+                    stacklevel=1,
+                )
+                # no stacklevel points at the users code, so we set stacklevel=1
+                # so it at least indicates that it's the plugin complaining.
+                # Pytest gives the test file & name in the warnings summary at least
 
         else:
             pyfuncitem.warn(
@@ -890,10 +1991,42 @@ def pytest_pyfunc_call(pyfuncitem: Function) -> object | None:
     return None
 
 
+_unmarked_async_fixtures_key = StashKey[tuple[str, ...]]()
+_unmarked_async_fixturedefs_key = StashKey[dict[FixtureDef, bool]]()
+
+
+def _unmarked_async_fixtures(item: Function) -> tuple[str, ...]:
+    """
+    Return the names of the async fixtures requested by the item that are
+    declared with @pytest.fixture rather than @pytest_asyncio.fixture.
+
+    The result is determined once per fixture definition and shared by all items
+    requesting the fixture.
+    """
+    unmarked_fixturedefs = item.config.stash.setdefault(
+        _unmarked_async_fixturedefs_key, {}
+    )
+    names = []
+    for name, fixturedefs in item._fixtureinfo.name2fixturedefs.items():
+        # name2fixturedefs is a dict between fixture name and a list of matching
+        # fixturedefs. The last entry in the list is closest and the one used.
+        fixturedef = fixturedefs[-1]
+        unmarked = unmarked_fixturedefs.get(fixturedef)
+        if unmarked is None:
+            func = fixturedef.func
+            is_async = _is_coroutine_or_asyncgen(func)
+            unmarked = is_async and not _is_asyncio_fixture_function(func)
+            unmarked_fixturedefs[fixturedef] = unmarked
+        if unmarked:
+            names.append(name)
+    return tuple(names)
+
+
 def _synchronize_coroutine(
     func: Callable[..., CoroutineType],
     runner: asyncio.Runner,
     context: contextvars.Context,
+    timeout: float | None = None,
 ):
     """
     Return a sync wrapper around a coroutine executing it in the
@@ -903,11 +2036,116 @@ def _synchronize_coroutine(
     @functools.wraps(func)
     def inner(*args, **kwargs):
         coro = func(*args, **kwargs)
+        if timeout is not None:
+            coro = _cancel_on_timeout(coro, timeout)
         runner.run(coro, context=context)
 
     return inner
 
 
+_leaked_task_origins_key = StashKey[weakref.WeakKeyDictionary[asyncio.Task, str]]()
+
+
+def _format_leaked_tasks_report(summary: str, tasks: Iterable[asyncio.Task]) -> str:
+    """
+    Describe each task, including the stack at its creation if the loop is in
+    debug mode.
+    """
+    lines = [f"{summary}:"]
+    for task in sorted(tasks, key=lambda task: task.get_name()):
+        lines.append(f"  {task!r}")
+        source_traceback = getattr(task, "_source_traceback", None)
+        if source_traceback:
+            lines.append("  Created at (most recent call last):")
+            lines.extend(
+                textwrap.indent(frame, "  ").rstrip("\n")
+                for frame in traceback.format_list(source_traceback)
+            )
+    return "\n".join(lines)
+
+
+def _report_leaked_tasks(mode: str, report: str) -> None:
+    if mode == "error":
+        pytest.fail(report, pytrace=False)
+    warnings.warn(report, RuntimeWarning, stacklevel=2)
+
+
+_TEST_TIMEOUT_MESSAGE = """\
+Test coroutine did not complete within {timeout} seconds and was cancelled.
+Stacks of the pending tasks at the time of the timeout:
+
+{task_stacks}"""
+
+
+def _format_task_stacks(loop: AbstractEventLoop) -> str:
+    task_stacks = []
+    for task in asyncio.all_tasks(loop):
+        # Task.print_stack only shows the outermost coroutine of a task.
+        # Follow the chain of awaited coroutines to show where the task
+        # is actually suspended.
+        frames = []
+        awaitable: Any = task.get_coro()
+        while awaitable is not None:
+            frame = getattr(awaitable, "cr_frame", None) or getattr(
+                awaitable, "gi_frame", None
+            )
+            if frame is None:
+                break
+            if frame.f_code is not _cancel_on_timeout.__code__:
+                frames.append((frame, frame.f_lineno))
+            awaitable = getattr(awaitable, "cr_await", None) or getattr(
+                awaitable, "gi_yieldfrom", None
+            )
+        stack = "".join(traceback.StackSummary.extract(frames).format())
+        task_stacks.append(f"Stack for {task!r} (most recent call last):\n{stack}")
+    return "\n".join(task_stacks)
+
+
+async def _cancel_on_timeout(coro: CoroutineType[Any, Any, _T], timeout: float) -> _T:
+    """
+    Await the coroutine and cancel it when it doesn't finish within the timeout.
+
+    The timeout is measured with the wall clock rather than the loop clock,
+    so that it also applies to loops with a virtual clock.
+    """
+    loop = asyncio.get_running_loop()
+    task = asyncio.current_task()
+    assert task is not None
+    task_stacks: str | None = None
+
+    def cancel_task() -> None:
+        nonlocal task_stacks
+        if task.done():
+            return
+        task_stacks = _format_task_stacks(loop)
+        task.cancel()
+
+    def cancel_task_threadsafe() -> None:
+        with contextlib.suppress(RuntimeError):  # The loop may be closed already
+            loop.call_soon_threadsafe(cancel_task)
+
+    timer = threading.Timer(timeout, cancel_task_threadsafe)
+    timer.daemon = True
+    timer.start()
+    try:
+        result = await coro
+    except BaseException:
+        if task_stacks is None:
+            raise
+    finally:
+        timer.cancel()
+    if task_stacks is None:
+        return result
+    # The test may have caught the cancellation and finished regularly. It timed
+    # out nonetheless and its cancellation must not leak into the teardown.
+    if sys.version_info >= (3, 11):
+        task.uncancel()
+    pytest.fail(
+        _TEST_TIMEOUT_MESSAGE.format(timeout=timeout, task_stacks=task_stacks),
+        pytrace=False,
+    )
+
+
 @pytest.hookimpl(wrapper=True)
 def pytest_fixture_setup(fixturedef: FixtureDef, request) -> object | None:
     if (
@@ -917,20 +2155,9 @@ def pytest_fixture_setup(fixturedef: FixtureDef, request) -> object | None:
         warnings.warn(
             PytestDeprecationWarning(_EVENT_LOOP_POLICY_FIXTURE_DEPRECATION_WARNING),
         )
-    asyncio_mode = _get_asyncio_mode(request.config)
-    if not _is_asyncio_fixture_function(fixturedef.func):
-        if asyncio_mode == Mode.STRICT:
-            # Ignore async fixtures without explicit asyncio mark in strict mode
-            # This applies to pytest_trio fixtures, for example
-            return (yield)
-        if not _is_coroutine_or_asyncgen(fixturedef.func):
-            return (yield)
-    default_loop_scope = request.config.getini("asyncio_default_fixture_loop_scope")
-    loop_scope = (
-        getattr(fixturedef.func, "_loop_scope", None)
-        or default_loop_scope
-        or fixturedef.scope
-    )
+    if not _is_asyncio_fixture(fixturedef, request.config):
+        return (yield)
+    loop_scope = _get_fixture_loop_scope(fixturedef, request.config)
     runner_fixture_id = f"_{loop_scope}_scoped_runner"
     runner = request.getfixturevalue(runner_fixture_id)
     # Prevent the runner closing before the fixture's async teardown.
@@ -946,6 +2173,33 @@ def pytest_fixture_setup(fixturedef: FixtureDef, request) -> object | None:
     return hook_result
 
 
+def _is_asyncio_fixture(fixturedef: FixtureDef, config: Config) -> bool:
+    """Returns whether pytest-asyncio is responsible for setting up the fixture."""
+    if _is_asyncio_fixture_function(fixturedef.func):
+        return True
+    # Ignore async fixtures without explicit asyncio mark in strict mode
+    # This applies to pytest_trio fixtures, for example
+    return _get_settings(config).mode == Mode.AUTO and _is_coroutine_or_asyncgen(
+        fixturedef.func
+    )
+
+
+def _get_fixture_loop_scope(fixturedef: FixtureDef, config: Config) -> _ScopeName:
+    default_loop_scope = _get_settings(config).default_fixture_loop_scope
+    return (
+        getattr(fixturedef.func, "_loop_scope", None)
+        or default_loop_scope
+        or fixturedef.scope
+    )
+
+
+def _get_fixture_propagate_context(fixturedef: FixtureDef, config: Config) -> bool:
+    propagate_context = getattr(fixturedef.func, "_propagate_context", None)
+    if propagate_context is None:
+        return _get_settings(config).propagate_fixture_context
+    return propagate_context
+
+
 _DUPLICATE_LOOP_SCOPE_DEFINITION_ERROR = """\
 An asyncio pytest marker defines both "scope" and "loop_scope", \
 but it should only use "loop_scope".
@@ -960,6 +2214,22 @@ _INVALID_LOOP_FACTORIES_KWARG = """\
 mark.asyncio 'loop_factories' must be a non-empty sequence of strings.
 """
 
+_INVALID_TIMEOUT_KWARG = """\
+mark.asyncio 'timeout' must be a non-negative number of seconds or None.
+"""
+
+_INVALID_SHARED_EXECUTOR_KWARG = """\
+mark.asyncio 'shared_executor' must be a boolean.
+"""
+
+_INVALID_TASK_FACTORY_KWARG = """\
+mark.asyncio 'task_factory' must be one of 'default' or 'eager'.
+"""
+
+_UNSUPPORTED_EAGER_TASK_FACTORY = """\
+mark.asyncio task_factory='eager' requires Python 3.12 or later.
+"""
+
 _EVENT_LOOP_POLICY_FIXTURE_DEPRECATION_WARNING = """\
 Overriding the "event_loop_policy" fixture is deprecated \
 and will be removed in a future version of pytest-asyncio. \
@@ -994,19 +2264,41 @@ def _parse_asyncio_marker(
     return scope, marker_value
 
 
+_ASYNCIO_MARKER_KWARGS = (
+    "loop_scope",
+    "loop_factories",
+    "timeout",
+    "shared_executor",
+    "task_factory",
+)
+
+
 def _validate_asyncio_marker(asyncio_marker: Mark) -> None:
     if asyncio_marker.args or (
         asyncio_marker.kwargs
-        and set(asyncio_marker.kwargs) - {"loop_scope", "scope", "loop_factories"}
+        and set(asyncio_marker.kwargs) - {"scope", *_ASYNCIO_MARKER_KWARGS}
     ):
-        msg = (
-            "mark.asyncio accepts only keyword arguments 'loop_scope' and"
-            " 'loop_factories'."
-        )
+        accepted_kwargs = ", ".join(f"'{kwarg}'" for kwarg in _ASYNCIO_MARKER_KWARGS)
+        msg = f"mark.asyncio accepts only keyword arguments {accepted_kwargs}."
         raise ValueError(msg)
-
-
-def _get_default_test_loop_scope(config: Config) -> Any:
+    timeout = asyncio_marker.kwargs.get("timeout")
+    if timeout is not None and (
+        isinstance(timeout, bool)
+        or not isinstance(timeout, (int, float))
+        or timeout < 0
+    ):
+        raise ValueError(_INVALID_TIMEOUT_KWARG)
+    shared_executor = asyncio_marker.kwargs.get("shared_executor")
+    if shared_executor is not None and not isinstance(shared_executor, bool):
+        raise ValueError(_INVALID_SHARED_EXECUTOR_KWARG)
+    task_factory = asyncio_marker.kwargs.get("task_factory")
+    if task_factory is not None and task_factory not in _TASK_FACTORIES:
+        raise ValueError(_INVALID_TASK_FACTORY_KWARG)
+    if task_factory == "eager" and sys.version_info < (3, 12):
+        raise ValueError(_UNSUPPORTED_EAGER_TASK_FACTORY)
+
+
+def _parse_default_test_loop_scope(config: Config) -> _ScopeName:
     return config.getini("asyncio_default_test_loop_scope")
 
 
@@ -1021,6 +2313,397 @@ Here is the traceback of the exception triggered during teardown:
 """
 
 
+def _unreported_pending_tasks(
+    config: Config, loop: AbstractEventLoop
+) -> set[asyncio.Task]:
+    """Returns the pending tasks of the loop that weren't reported as leaked yet."""
+    if loop.is_closed():
+        return set()
+    reported_tasks = config.stash.get(_leaked_task_origins_key, None)
+    if reported_tasks is None:
+        return asyncio.all_tasks(loop)
+    return {task for task in asyncio.all_tasks(loop) if task not in reported_tasks}
+
+
+class _LoopPool:
+    """Idle event loops that can be reused by function-scoped runners."""
+
+    def __init__(self) -> None:
+        self._idle_loops: dict[Hashable, AbstractEventLoop] = {}
+
+    def acquire(
+        self, key: Hashable, loop_factory: LoopFactory | None
+    ) -> AbstractEventLoop:
+        loop = self._idle_loops.pop(key, None)
+        if loop is not None:
+            return loop
+        if loop_factory is None:
+            return asyncio.new_event_loop()
+        return loop_factory()
+
+    def release(self, key: Hashable, loop: AbstractEventLoop) -> None:
+        previous_loop = self._idle_loops.pop(key, None)
+        if previous_loop is not None:
+            previous_loop.close()
+        self._idle_loops[key] = loop
+
+    def close(self) -> None:
+        while self._idle_loops:
+            _, loop = self._idle_loops.popitem()
+            loop.close()
+
+
+_loop_pool_key = StashKey[_LoopPool]()
+
+
+class _PooledRunner(Runner):  # type: ignore[misc]
+    """
+    Runner that resets its event loop and returns it to a pool when closed.
+
+    The loop is only reused if it passes the isolation checks after the reset.
+    Otherwise, it is closed like by a regular runner.
+    """
+
+    def __init__(
+        self,
+        pool: _LoopPool,
+        key: Hashable,
+        config: Config,
+        *,
+        debug: bool | None = None,
+        loop_factory: LoopFactory | None = None,
+    ) -> None:
+        super().__init__(
+            debug=debug,
+            loop_factory=_managed_loop_factory(
+                functools.partial(pool.acquire, key, loop_factory), config
+            ),
+        )
+        self._pool = pool
+        self._pool_key = key
+
+    def close(self) -> None:
+        loop = _get_runner_loop(self)
+        if loop is None or type(loop) not in _POOLABLE_LOOP_TYPES or loop.is_closed():
+            return super().close()
+        assert isinstance(loop, asyncio.BaseEventLoop)
+        reusable = False
+        try:
+            _reset_event_loop(loop)
+            reusable = _is_pristine_event_loop(loop)
+        finally:
+            if reusable:
+                self._pool.release(self._pool_key, loop)
+            else:
+                loop.close()
+            self._loop: AbstractEventLoop | None = None
+            self._state = type(self._state).CLOSED  # type: ignore[has-type]
+
+
+class _ThreadedRunner(Runner):  # type: ignore[misc]
+    """
+    Runner whose event loop runs forever on a dedicated thread.
+
+    Coroutines are submitted to the loop from the calling thread, so the loop
+    doesn't stop and restart for every call. Tasks started by tests and
+    fixtures keep running in between calls, e.g. while pytest runs the next
+    synchronous fixture.
+    """
+
+    def __init__(
+        self,
+        thread_name: str,
+        *,
+        debug: bool | None = None,
+        loop_factory: LoopFactory,
+    ) -> None:
+        super().__init__(debug=debug)
+        self._thread_name = thread_name
+        self._threaded_loop_factory = loop_factory
+        self._thread: threading.Thread | None = None
+        self._pending_calls: set[concurrent.futures.Future] = set()
+        self._closed = False
+
+    def get_loop(self) -> AbstractEventLoop:
+        if self._closed:
+            raise RuntimeError("Runner is closed")
+        if self._thread is None:
+            self._start()
+        assert self._loop is not None
+        return self._loop
+
+    def _start(self) -> None:
+        loop = self._threaded_loop_factory()
+        if self._debug is not None:  # type: ignore[attr-defined]
+            loop.set_debug(self._debug)  # type: ignore[attr-defined]
+        self._loop: AbstractEventLoop | None = loop
+        self._context = contextvars.copy_context()
+        self._thread = threading.Thread(
+            target=self._run_forever, args=(loop,), name=self._thread_name, daemon=True
+        )
+        self._thread.start()
+
+    def _run_forever(self, loop: AbstractEventLoop) -> None:
+        try:
+            loop.run_forever()
+        except BaseException as e:
+            # Tasks propagate KeyboardInterrupt and SystemExit out of the loop.
+            # Hand them to the threads waiting for a result, which would
+            # otherwise wait forever.
+            for future in list(self._pending_calls):
+                if not future.done():
+                    future.set_exception(e)
+
+    def call(self, func: Callable[..., _T], /, *args: Any, **kwargs: Any) -> _T:
+        """Call the function on the thread of the event loop and return its result."""
+        loop = self.get_loop()
+        if threading.current_thread() is self._thread:
+            return func(*args, **kwargs)
+        future: concurrent.futures.Future[_T] = concurrent.futures.Future()
+
+        def call_on_loop() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(func(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+        loop.call_soon_threadsafe(call_on_loop)
+        return self._wait(future)
+
+    def run(
+        self,
+        coro: Awaitable[_T],
+        *,
+        context: contextvars.Context | None = None,
+    ) -> _T:
+        if not inspect.iscoroutine(coro):
+            raise ValueError(f"a coroutine was expected, got {coro!r}")
+        if threading.current_thread() is self._thread:
+            raise RuntimeError(
+                "Runner.run() cannot be called from the thread of its event loop"
+            )
+        loop = self.get_loop()
+        if context is None:
+            context = self._context
+        future: concurrent.futures.Future[_T] = concurrent.futures.Future()
+
+        def start_task() -> asyncio.Task[_T]:
+            task = loop.create_task(coro, context=context)
+            task.add_done_callback(functools.partial(_copy_task_outcome, future))
+            return task
+
+        task = self.call(start_task)
+        try:
+            return self._wait(future)
+        except BaseException:
+            if not task.done():
+                loop.call_soon_threadsafe(task.cancel)
+            raise
+
+    def _wait(self, future: concurrent.futures.Future[_T]) -> _T:
+        self._pending_calls.add(future)
+        try:
+            if self._thread is not None and not self._thread.is_alive():
+                raise RuntimeError("The event loop thread is no longer running")
+            return future.result()
+        finally:
+            self._pending_calls.discard(future)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        loop, thread = self._loop, self._thread
+        if loop is None or thread is None:
+            return
+        try:
+            if thread.is_alive():
+                try:
+                    future = asyncio.run_coroutine_threadsafe(
+                        _shut_down_event_loop(), loop
+                    )
+                    self._wait(future)
+                finally:
+                    loop.call_soon_threadsafe(loop.stop)
+                    thread.join()
+            elif not loop.is_closed():
+                loop.run_until_complete(_shut_down_event_loop())
+        finally:
+            if not loop.is_closed():
+                loop.close()
+            self._loop = None
+
+
+def _copy_task_outcome(
+    future: concurrent.futures.Future[_T], task: asyncio.Task[_T]
+) -> None:
+    if task.cancelled():
+        future.set_exception(asyncio.CancelledError())
+    elif task.exception() is not None:
+        future.set_exception(task.exception())
+    else:
+        future.set_result(task.result())
+
+
+async def _shut_down_event_loop() -> None:
+    """Clean up the running event loop like asyncio.Runner does before closing it."""
+    loop = asyncio.get_running_loop()
+    current_task = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks(loop) if task is not current_task]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    for task in tasks:
+        if not task.cancelled() and task.exception() is not None:
+            loop.call_exception_handler(
+                {
+                    "message": "unhandled exception during event loop shutdown",
+                    "exception": task.exception(),
+                    "task": task,
+                }
+            )
+    await loop.shutdown_asyncgens()
+    await loop.shutdown_default_executor()
+
+
+def _managed_loop_factory(
+    loop_factory: Callable[[], AbstractEventLoop], config: Config
+) -> Callable[[], AbstractEventLoop]:
+    """
+    Wrap the loop factory, so that the loops it creates are configured
+    according to the pytest-asyncio settings and become the current event loop.
+
+    Runners only set the current event loop themselves, when they don't use a
+    loop factory.
+    """
+
+    def create_loop() -> AbstractEventLoop:
+        loop = loop_factory()
+        _remember_task_factory(loop)
+        task_factory = _resolve_task_factory(_get_settings(config).task_factory_name)
+        if task_factory is not None:
+            loop.set_task_factory(task_factory)
+        if _get_settings(config).shared_executor:
+            _install_shared_executor(loop, config)
+        managed_loops = config.stash.get(_managed_loops_key, None)
+        if managed_loops is not None:
+            managed_loops.add(loop)
+            _observe_test_loop(config, loop)
+        _set_event_loop(loop)
+        return loop
+
+    return create_loop
+
+
+_shared_executor_key = StashKey[ThreadPoolExecutor]()
+
+
+def _install_shared_executor(loop: AbstractEventLoop, config: Config) -> None:
+    """
+    Use the session-wide executor as default executor of the loop, unless the
+    loop already has a default executor.
+    """
+    # Only loops based on BaseEventLoop allow us to detach the executor again
+    if (
+        not isinstance(loop, asyncio.BaseEventLoop)
+        or loop._default_executor is not None  # type: ignore[attr-defined]
+    ):
+        return
+    shared_executor = config.stash.get(_shared_executor_key, None)
+    if shared_executor is None:
+        shared_executor = ThreadPoolExecutor(
+            max_workers=_get_settings(config).shared_executor_workers,
+            thread_name_prefix="pytest-asyncio",
+        )
+        config.stash[_shared_executor_key] = shared_executor
+    loop.set_default_executor(shared_executor)
+
+
+def _detach_shared_executor(loop: AbstractEventLoop, config: Config) -> None:
+    """
+    Remove the session-wide executor from the loop, so that it is not shut down
+    along with the loop.
+    """
+    shared_executor = config.stash.get(_shared_executor_key, None)
+    if (
+        shared_executor is not None
+        and getattr(loop, "_default_executor", None) is shared_executor
+    ):
+        loop._default_executor = None  # type: ignore[attr-defined]
+
+
+def _get_runner_loop(runner: Runner) -> AbstractEventLoop | None:
+    """Returns the loop of the runner, or None if it has not been created yet."""
+    return runner._loop  # type: ignore[attr-defined]
+
+
+# Event loop types whose internal state is known to be restored by a reset
+_POOLABLE_LOOP_TYPES: set[type[AbstractEventLoop]] = {
+    asyncio.SelectorEventLoop,
+    VirtualTimeEventLoop,
+}
+if sys.platform == "win32":
+    _POOLABLE_LOOP_TYPES.add(asyncio.ProactorEventLoop)
+
+
+def _reset_event_loop(loop: asyncio.BaseEventLoop) -> None:
+    """
+    Clean up the loop like asyncio.Runner does before closing it, and restore
+    the loop settings that tests may have changed.
+
+    The loop must be one of the _POOLABLE_LOOP_TYPES.
+    """
+    tasks = asyncio.all_tasks(loop)
+    if tasks:
+        for task in tasks:
+            task.cancel()
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        for task in tasks:
+            if not task.cancelled() and task.exception() is not None:
+                loop.call_exception_handler(
+                    {
+                        "message": "unhandled exception during event loop reset",
+                        "exception": task.exception(),
+                        "task": task,
+                    }
+                )
+    loop.run_until_complete(loop.shutdown_asyncgens())
+    loop.run_until_complete(loop.shutdown_default_executor())
+    # Allow the loop to track async generators and create a new default
+    # executor again after the shutdown
+    loop._asyncgens_shutdown_called = False  # type: ignore[attr-defined]
+    loop._executor_shutdown_called = False  # type: ignore[attr-defined]
+    loop._default_executor = None  # type: ignore[attr-defined]
+    loop.set_exception_handler(None)
+    loop.set_task_factory(_original_task_factories.get(loop))
+    loop.slow_callback_duration = 0.1
+    if isinstance(loop, VirtualTimeEventLoop):
+        loop._reset_time()
+
+
+def _is_pristine_event_loop(loop: asyncio.BaseEventLoop) -> bool:
+    """Returns whether the loop doesn't carry any state over to the next test."""
+    if loop.is_closed() or loop.is_running():
+        return False
+    if asyncio.all_tasks(loop) or loop._ready or loop._asyncgens:  # type: ignore[attr-defined]
+        return False
+    if any(not handle.cancelled() for handle in loop._scheduled):  # type: ignore[attr-defined]
+        return False
+    if loop._default_executor is not None or loop.get_exception_handler() is not None:  # type: ignore[attr-defined]
+        return False
+    if getattr(loop, "_signal_handlers", None):
+        return False
+    selector = getattr(loop, "_selector", None)
+    if selector is not None:
+        # Only the self-pipe used to wake up the loop may be registered
+        self_reading_fd = loop._ssock.fileno()  # type: ignore[attr-defined]
+        if any(key.fd != self_reading_fd for key in selector.get_map().values()):
+            return False
+    return True
+
+
 def _create_scoped_runner_fixture(scope: _ScopeName) -> Callable:
     @pytest.fixture(
         scope=scope,
@@ -1032,33 +2715,96 @@ def _create_scoped_runner_fixture(scope: _ScopeName) -> Callable:
         request: FixtureRequest,
     ) -> Iterator[Runner]:
         new_loop_policy = event_loop_policy
-        debug_mode = _get_asyncio_debug(request.config)
+        debug_mode = _get_settings(request.config).debug
+        loop_pool = request.config.stash.get(_loop_pool_key, None)
         with _temporary_event_loop_policy(new_loop_policy):
-            runner = Runner(
-                debug=debug_mode,
-                loop_factory=_asyncio_loop_factory,
-            ).__enter__()
-            if _asyncio_loop_factory is not None:
-                _set_event_loop(runner.get_loop())
+            # The runner creates its event loop lazily, when the first coroutine
+            # is submitted or the loop is requested. Tests and fixtures that
+            # never do so don't pay for a loop.
+            runner: Runner
+            if scope == "function" and loop_pool is not None:
+                runner = _PooledRunner(
+                    loop_pool,
+                    (new_loop_policy, _asyncio_loop_factory),
+                    request.config,
+                    debug=debug_mode,
+                    loop_factory=_asyncio_loop_factory,
+                )
+            else:
+                loop_factory = _asyncio_loop_factory or asyncio.new_event_loop
+                # Function-scoped loops stay on the calling thread, because
+                # starting a thread for every test outweighs the savings.
+                if scope != "function" and _get_settings(request.config).loop_thread:
+                    runner = _ThreadedRunner(
+                        f"pytest-asyncio-{scope}-loop",
+                        debug=debug_mode,
+                        loop_factory=_managed_loop_factory(
+                            loop_factory, request.config
+                        ),
+                    )
+                else:
+                    runner = Runner(
+                        debug=debug_mode,
+                        loop_factory=_managed_loop_factory(
+                            loop_factory, request.config
+                        ),
+                    )
+            runner_contexts = request.config.stash.setdefault(
+                _runner_contexts_key, weakref.WeakKeyDictionary()
+            )
+            runner_contexts[runner] = contextvars.copy_context()
             try:
                 yield runner
             except Exception as e:
+                loop = _get_runner_loop(runner)
+                if loop is not None:
+                    _detach_shared_executor(loop, request.config)
                 runner.__exit__(type(e), e, e.__traceback__)
             else:
-                with warnings.catch_warnings():
-                    warnings.filterwarnings(
-                        "ignore", ".*BaseEventLoop.shutdown_asyncgens.*", RuntimeWarning
-                    )
-                    try:
-                        runner.__exit__(None, None, None)
-                    except RuntimeError:
-                        warnings.warn(
-                            _RUNNER_TEARDOWN_WARNING % traceback.format_exc(),
+                leaked_tasks_mode = _get_settings(request.config).leaked_tasks_mode
+                leaked_tasks_report = None
+                try:
+                    _run_deferred_finalizers(request.config, runner)
+                finally:
+                    loop = _get_runner_loop(runner)
+                    if loop is not None:
+                        # The shared executor outlives the loop
+                        _detach_shared_executor(loop, request.config)
+                    if leaked_tasks_mode != "ignore" and loop is not None:
+                        if isinstance(runner, _ThreadedRunner):
+                            # The loop thread creates and finishes tasks
+                            # concurrently, so they are collected on that thread.
+                            leaked_tasks = runner.call(
+                                _unreported_pending_tasks, request.config, loop
+                            )
+                        else:
+                            leaked_tasks = _unreported_pending_tasks(
+                                request.config, loop
+                            )
+                        if leaked_tasks:
+                            # The runner cancels the tasks when it is closed
+                            leaked_tasks_report = _format_leaked_tasks_report(
+                                f"{len(leaked_tasks)} task(s) are still pending "
+                                f"when the {scope}-scoped event loop is closed",
+                                leaked_tasks,
+                            )
+                    with warnings.catch_warnings():
+                        warnings.filterwarnings(
+                            "ignore",
+                            ".*BaseEventLoop.shutdown_asyncgens.*",
                             RuntimeWarning,
                         )
+                        try:
+                            runner.__exit__(None, None, None)
+                        except RuntimeError:
+                            warnings.warn(
+                                _RUNNER_TEARDOWN_WARNING % traceback.format_exc(),
+                                RuntimeWarning,
+                            )
+                if leaked_tasks_report is not None:
+                    _report_leaked_tasks(leaked_tasks_mode, leaked_tasks_report)
             finally:
-                if _asyncio_loop_factory is not None:
-                    _set_event_loop(None)
+                _set_event_loop(None)
 
     return _scoped_runner
 
@@ -1085,6 +2831,96 @@ def is_async_test(item: Item) -> TypeIs[PytestAsyncioFunction]:
     return isinstance(item, PytestAsyncioFunction)
 
 
+_async_benchmarks_key = StashKey[list[tuple[str, dict[str, float]]]]()
+
+
+class AsyncBenchmark:
+    """
+    Times a coroutine function on the event loop of the running test.
+
+    The coroutine function is awaited repeatedly in rounds. The number of
+    iterations per round is calibrated, so that a round takes at least
+    *min_round_time* seconds. At least *min_rounds* rounds are run and further
+    rounds are added until *max_time* seconds have passed. Afterwards, a
+    single instrumented iteration counts the event loop callbacks it runs.
+    """
+
+    def __init__(
+        self,
+        item: Item,
+        *,
+        min_rounds: int = 5,
+        min_round_time: float = 0.001,
+        max_time: float = 1.0,
+    ) -> None:
+        self._item = item
+        self.min_rounds = min_rounds
+        self.min_round_time = min_round_time
+        self.max_time = max_time
+        self.stats: dict[str, float] | None = None
+
+    async def __call__(
+        self, func: Callable[..., Awaitable[_T]], /, *args: Any, **kwargs: Any
+    ) -> _T:
+        """
+        Benchmarks the coroutine function with the given arguments.
+
+        Returns the result of the last call.
+        """
+        if self.stats is not None:
+            raise RuntimeError("async_benchmark can only be used once per test.")
+        iterations = await self._calibrate(func, args, kwargs)
+        round_times: list[float] = []
+        start = time.perf_counter()
+        while (
+            len(round_times) < self.min_rounds
+            or time.perf_counter() - start < self.max_time
+        ):
+            duration, result = await self._run_round(func, args, kwargs, iterations)
+            round_times.append(duration / iterations)
+        with _collect_loop_stats() as loop_stats:
+            _, result = await self._run_round(func, args, kwargs, 1)
+        self.stats = {
+            "min": min(round_times),
+            "median": statistics.median(round_times),
+            "stddev": statistics.stdev(round_times) if len(round_times) > 1 else 0.0,
+            "rounds": len(round_times),
+            "iterations": iterations,
+            "callbacks_per_iteration": loop_stats.callbacks,
+        }
+        self._item.user_properties.append(("asyncio_benchmark", self.stats))
+        self._item.config.stash.setdefault(_async_benchmarks_key, []).append(
+            (self._item.nodeid, self.stats)
+        )
+        return result
+
+    async def _calibrate(
+        self, func: Callable[..., Awaitable[Any]], args: tuple, kwargs: dict
+    ) -> int:
+        iterations = 1
+        while True:
+            duration, _ = await self._run_round(func, args, kwargs, iterations)
+            if duration >= self.min_round_time:
+                return iterations
+            estimate = iterations * self.min_round_time / max(duration, 1e-9)
+            iterations = max(iterations * 2, int(estimate) + 1)
+
+    @staticmethod
+    async def _run_round(
+        func: Callable[..., Awaitable[_T]], args: tuple, kwargs: dict, iterations: int
+    ) -> tuple[float, _T]:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            result = await func(*args, **kwargs)
+        return time.perf_counter() - start, result
+
+
+@pytest.fixture
+def async_benchmark(request: FixtureRequest) -> AsyncBenchmark:
+    """Times a coroutine function on the event loop of the running test."""
+    return AsyncBenchmark(request.node)
+
+
 def _unused_port(socket_type: int) -> int:
     """Find an unused localhost port from 1024-65535 and return it."""
     with contextlib.closing(socket.socket(type=socket_type)) as sock:
@@ -1092,49 +2928,385 @@ def _unused_port(socket_type: int) -> int:
         return sock.getsockname()[1]
 
 
+class _PortRegistry:
+    """
+    Ports leased by the worker processes of a pytest-xdist run.
+
+    The leases are stored in a JSON file shared by all workers. The file is
+    locked while it is read or modified, so that the workers hand out disjoint
+    sets of ports.
+    """
+
+    def __init__(self, path: Path, owner: str) -> None:
+        self._path = path
+        self._lock_path = path.with_name(path.name + ".lock")
+        self._owner = owner
+
+    @contextlib.contextmanager
+    def _leases(self) -> Iterator[dict[str, str]]:
+        with open(self._lock_path, "a+b") as lock_file:
+            _lock_file(lock_file.fileno())
+            try:
+                try:
+                    leases = json.loads(self._path.read_text())
+                except FileNotFoundError:
+                    leases = {}
+                original_leases = dict(leases)
+                yield leases
+                if leases != original_leases:
+                    self._path.write_text(json.dumps(leases))
+            finally:
+                _unlock_file(lock_file.fileno())
+
+    def lease(self, socket_type: int, port: int) -> bool:
+        """Lease the port, unless it is leased already."""
+        return bool(self.lease_many(socket_type, [port]))
+
+    def lease_many(
+        self, socket_type: int, ports: Iterable[int], *, atomic: bool = False
+    ) -> list[int]:
+        """
+        Lease the ports that aren't leased already and return them.
+
+        If atomic is true, either all ports are leased or none.
+        """
+        keys = {port: f"{socket_type}:{port}" for port in ports}
+        with self._leases() as leases:
+            available = [port for port, key in keys.items() if key not in leases]
+            if atomic and len(available) < len(keys):
+                return []
+            for port in available:
+                leases[keys[port]] = self._owner
+            return available
+
+    def release(self) -> None:
+        """Release all ports leased by the owner of the registry."""
+        with self._leases() as leases:
+            for key, owner in list(leases.items()):
+                if owner == self._owner:
+                    del leases[key]
+
+    def release_many(self, socket_type: int, ports: Iterable[int]) -> None:
+        """Release the ports, if they are leased by the owner of the registry."""
+        with self._leases() as leases:
+            for port in ports:
+                key = f"{socket_type}:{port}"
+                if leases.get(key) == self._owner:
+                    del leases[key]
+
+    def drop_stale_leases(self) -> None:
+        """Release the ports leased by workers that aren't running anymore."""
+        with self._leases() as leases:
+            for key, owner in list(leases.items()):
+                if not _is_owner_alive(owner):
+                    del leases[key]
+
+
+def _is_owner_alive(owner: str) -> bool:
+    """
+    Return whether the process that owns a port lease is running.
+
+    Owners are formatted as "<worker id>:<pid>". Owners without a pid and
+    owners on Windows, where signalling a process terminates it, are
+    considered alive.
+    """
+    _, _, pid = owner.rpartition(":")
+    if sys.platform == "win32" or not pid.isdigit():
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+if sys.platform == "win32":
+
+    def _lock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+
+    def _lock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+@pytest.fixture(scope="session")
+def _port_registry(
+    tmp_path_factory: TempPathFactory,
+) -> Iterator[_PortRegistry | None]:
+    """
+    Coordinate the ports handed out by the workers of a pytest-xdist run.
+
+    Yields None when pytest doesn't run as a pytest-xdist worker.
+    """
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker_id is None:
+        yield None
+        return
+    # The base temporary directories of the workers share the same parent
+    shared_dir = tmp_path_factory.getbasetemp().parent
+    registry = _PortRegistry(
+        shared_dir / "pytest-asyncio-ports.json", f"{worker_id}:{os.getpid()}"
+    )
+    # Leases of crashed workers would otherwise block their ports for the
+    # rest of the run
+    registry.drop_stale_leases()
+    try:
+        yield registry
+    finally:
+        registry.release()
+
+
+_MAX_LEASE_ATTEMPTS = 100
+
+
+def _unused_leased_port(socket_type: int, registry: _PortRegistry | None) -> int:
+    """Find an unused port that isn't leased by another pytest-xdist worker."""
+    for _ in range(_MAX_LEASE_ATTEMPTS):
+        port = _unused_port(socket_type)
+        if registry is None or registry.lease(socket_type, port):
+            return port
+    raise RuntimeError(
+        f"Could not find an unused port after {_MAX_LEASE_ATTEMPTS} attempts. "
+        "All ports returned by the operating system were leased by other "
+        "pytest-xdist workers."
+    )
+
+
+def _leased_port_fixture(
+    socket_type: int, registry: _PortRegistry | None
+) -> Iterator[int]:
+    port = _unused_leased_port(socket_type, registry)
+    try:
+        yield port
+    finally:
+        if registry is not None:
+            registry.release_many(socket_type, [port])
+
+
 @pytest.fixture
-def unused_tcp_port() -> int:
-    return _unused_port(socket.SOCK_STREAM)
+def unused_tcp_port(_port_registry: _PortRegistry | None) -> Iterator[int]:
+    yield from _leased_port_fixture(socket.SOCK_STREAM, _port_registry)
 
 
 @pytest.fixture
-def unused_udp_port() -> int:
-    return _unused_port(socket.SOCK_DGRAM)
+def unused_udp_port(_port_registry: _PortRegistry | None) -> Iterator[int]:
+    yield from _leased_port_fixture(socket.SOCK_DGRAM, _port_registry)
 
 
-@pytest.fixture(scope="session")
-def unused_tcp_port_factory() -> Callable[[], int]:
-    """A factory function, producing different unused TCP ports."""
-    produced = set()
+class UnusedPortFactory:
+    """
+    Produces unused localhost ports, each different from the ports produced
+    before.
+    """
+
+    _MAX_CONTIGUOUS_ATTEMPTS = 100
 
-    def factory():
+    def __init__(self, socket_type: int, registry: _PortRegistry | None) -> None:
+        self._socket_type = socket_type
+        self._registry = registry
+        self._produced: set[int] = set()
+
+    def __call__(self) -> int:
         """Return an unused port."""
-        port = _unused_port(socket.SOCK_STREAM)
+        port = _unused_leased_port(self._socket_type, self._registry)
 
-        while port in produced:
-            port = _unused_port(socket.SOCK_STREAM)
+        while port in self._produced:
+            port = _unused_leased_port(self._socket_type, self._registry)
 
-        produced.add(port)
+        self._produced.add(port)
 
         return port
 
-    return factory
+    def many(self, n: int, *, contiguous: bool = False) -> list[int]:
+        """
+        Return n different unused ports.
+
+        The sockets used to find the ports stay bound until the whole batch is
+        allocated, so the operating system doesn't hand out the same port
+        twice. If contiguous is true, the ports form a consecutive range.
+        """
+        if n < 0:
+            raise ValueError(f"Expected a non-negative number of ports, got {n}")
+        if n == 0:
+            return []
+        if contiguous:
+            ports = self._contiguous_ports(n)
+        else:
+            ports = self._distinct_ports(n)
+        self._produced.update(ports)
+        return ports
+
+    def _distinct_ports(self, n: int) -> list[int]:
+        ports: list[int] = []
+        with contextlib.ExitStack() as stack:
+            for _ in range(_MAX_LEASE_ATTEMPTS):
+                candidates = []
+                for _ in range(n - len(ports)):
+                    # Sockets of rejected ports stay bound as well, so that
+                    # they aren't picked again
+                    sock = stack.enter_context(_bound_socket(self._socket_type))
+                    port = sock.getsockname()[1]
+                    if port not in self._produced:
+                        candidates.append(port)
+                if self._registry is not None:
+                    candidates = self._registry.lease_many(
+                        self._socket_type, candidates
+                    )
+                ports.extend(candidates)
+                if len(ports) == n:
+                    return ports
+        if self._registry is not None:
+            self._registry.release_many(self._socket_type, ports)
+        raise RuntimeError(
+            f"Could not find {n} unused ports after {_MAX_LEASE_ATTEMPTS} "
+            "attempts. The ports returned by the operating system were "
+            "leased by other pytest-xdist workers."
+        )
+
+    def _contiguous_ports(self, n: int) -> list[int]:
+        for _ in range(self._MAX_CONTIGUOUS_ATTEMPTS):
+            with contextlib.ExitStack() as stack:
+                first_socket = stack.enter_context(_bound_socket(self._socket_type))
+                first_port = first_socket.getsockname()[1]
+                ports = list(range(first_port, first_port + n))
+                if ports[-1] > 65535 or self._produced.intersection(ports):
+                    continue
+                try:
+                    for port in ports[1:]:
+                        sock = stack.enter_context(
+                            socket.socket(type=self._socket_type)
+                        )
+                        sock.bind(("127.0.0.1", port))
+                except OSError:
+                    continue
+                if self._registry is None or self._registry.lease_many(
+                    self._socket_type, ports, atomic=True
+                ):
+                    return ports
+        raise RuntimeError(f"Could not find {n} contiguous unused ports")
 
 
 @pytest.fixture(scope="session")
-def unused_udp_port_factory() -> Callable[[], int]:
+def unused_tcp_port_factory(
+    _port_registry: _PortRegistry | None,
+) -> UnusedPortFactory:
+    """A factory function, producing different unused TCP ports."""
+    return UnusedPortFactory(socket.SOCK_STREAM, _port_registry)
+
+
+@pytest.fixture(scope="session")
+def unused_udp_port_factory(
+    _port_registry: _PortRegistry | None,
+) -> UnusedPortFactory:
     """A factory function, producing different unused UDP ports."""
-    produced = set()
+    return UnusedPortFactory(socket.SOCK_DGRAM, _port_registry)
 
-    def factory():
-        """Return an unused port."""
-        port = _unused_port(socket.SOCK_DGRAM)
 
-        while port in produced:
-            port = _unused_port(socket.SOCK_DGRAM)
+def _bound_socket(socket_type: int, *, listen: bool = False) -> socket.socket:
+    """Return a socket bound to an unused localhost port."""
+    sock = socket.socket(type=socket_type)
+    try:
+        sock.bind(("127.0.0.1", 0))
+        if listen:
+            sock.listen()
+    except BaseException:
+        sock.close()
+        raise
+    return sock
 
-        produced.add(port)
 
-        return port
+@pytest.fixture
+def unused_tcp_socket() -> Iterator[socket.socket]:
+    """A TCP socket bound to an unused port, which is closed after the test."""
+    with _bound_socket(socket.SOCK_STREAM) as sock:
+        yield sock
+
+
+@pytest.fixture
+def unused_udp_socket() -> Iterator[socket.socket]:
+    """A UDP socket bound to an unused port, which is closed after the test."""
+    with _bound_socket(socket.SOCK_DGRAM) as sock:
+        yield sock
 
-    return factory
+
+@pytest.fixture
+def unused_tcp_socket_factory() -> Iterator[Callable[..., socket.socket]]:
+    """A factory function, producing TCP sockets bound to different unused ports."""
+    sockets: list[socket.socket] = []
+
+    def factory(*, listen: bool = False) -> socket.socket:
+        """Return a socket bound to an unused port, optionally listening."""
+        sock = _bound_socket(socket.SOCK_STREAM, listen=listen)
+        sockets.append(sock)
+        return sock
+
+    yield factory
+    for sock in sockets:
+        sock.close()
+
+
+@pytest.fixture
+def unused_udp_socket_factory() -> Iterator[Callable[[], socket.socket]]:
+    """A factory function, producing UDP sockets bound to different unused ports."""
+    sockets: list[socket.socket] = []
+
+    def factory() -> socket.socket:
+        """Return a socket bound to an unused port."""
+        sock = _bound_socket(socket.SOCK_DGRAM)
+        sockets.append(sock)
+        return sock
+
+    yield factory
+    for sock in sockets:
+        sock.close()
+
+
+# Size of sun_path in struct sockaddr_un on macOS and the BSDs. Linux allows
+# slightly longer paths.
+_SUN_PATH_MAX = 104
+
+
+def _unix_socket_base_dir() -> str:
+    """Return a temporary directory that is short enough for socket paths."""
+    temp_dir = tempfile.gettempdir()
+    # Leave room for the directory created by mkdtemp and the socket file name
+    if len(os.fsencode(temp_dir)) + 40 <= _SUN_PATH_MAX or not os.path.isdir("/tmp"):
+        return temp_dir
+    return "/tmp"
+
+
+@pytest.fixture(scope="session")
+def unix_socket_path_factory() -> Iterator[Callable[[], str]]:
+    """A factory function, producing different unused Unix domain socket paths."""
+    if not hasattr(socket, "AF_UNIX"):
+        pytest.skip("Unix domain sockets are not supported on this platform")
+    # Each pytest process, i.e. each pytest-xdist worker, uses its own directory
+    directory = tempfile.mkdtemp(prefix="pytest-asyncio-", dir=_unix_socket_base_dir())
+    counter = itertools.count()
+
+    def factory() -> str:
+        """Return an unused socket path."""
+        return os.path.join(directory, f"{next(counter)}.sock")
+
+    try:
+        yield factory
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def unused_unix_socket_path(unix_socket_path_factory: Callable[[], str]) -> str:
+    """An unused path for a Unix domain socket, which is removed after the session."""
+    return unix_socket_path_factory()
@@ -5,6 +5,9 @@ contextvars were not properly maintained among fixtures and tests.
 
 from __future__ import annotations
 
+import contextvars
+import sys
+from contextvars import ContextVar
 from textwrap import dedent
 from typing import Literal
 
@@ -180,6 +183,104 @@ def test_var_set_to_existing_value_ok(pytester: Pytester):
     result.assert_outcomes(passed=1)
 
 
+def test_var_among_many_vars_propagates_and_resets(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(_prelude + dedent("""
+        _other_vars = [ContextVar(f"var_{index}") for index in range(1000)]
+        for index, var in enumerate(_other_vars):
+            var.set(index)
+
+        @pytest_asyncio.fixture
+        async def unchanged_fixture():
+            yield
+            assert _context_var.get("unset") == "unset"
+
+        @pytest_asyncio.fixture
+        async def var_fixture(unchanged_fixture):
+            _other_vars[500].set(-1)
+            with context_var_manager("value"):
+                yield
+
+        @pytest.mark.asyncio
+        async def test(var_fixture):
+            assert _context_var.get() == "value"
+            assert _other_vars[500].get() == -1
+            assert _other_vars[501].get() == 501
+
+        def test_reset():
+            assert _context_var.get("unset") == "unset"
+            assert _other_vars[500].get() == 500
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=2)
+
+
+def test_unchanged_context_is_not_compared_variable_by_variable(
+    pytester: Pytester,
+):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(_prelude + dedent("""
+        import pytest_asyncio.plugin
+
+        _other_vars = [ContextVar(f"var_{index}") for index in range(1000)]
+        for index, var in enumerate(_other_vars):
+            var.set(index)
+
+        @pytest.fixture(autouse=True)
+        def forbid_contextvar_comparison(monkeypatch):
+            def fail(*args):
+                raise AssertionError("Compared the contextvars of an unchanged context")
+
+            monkeypatch.setattr(
+                pytest_asyncio.plugin, "_set_changed_contextvars", fail
+            )
+
+        @pytest_asyncio.fixture
+        async def unchanged_fixture():
+            yield
+
+        @pytest.mark.asyncio
+        async def test(unchanged_fixture):
+            assert _other_vars[500].get() == 500
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+def test_changed_context_is_compared_without_a_call_per_variable():
+    import pytest_asyncio.plugin
+
+    other_vars = [ContextVar(f"var_{index}") for index in range(1000)]
+    changed_var = ContextVar("changed_var")
+
+    def apply_fixture_context() -> int:
+        for index, var in enumerate(other_vars):
+            var.set(index)
+        changed_var.set("before")
+        fixture_context = contextvars.copy_context()
+        fixture_context.run(changed_var.set, "after")
+        calls = 0
+
+        def count_calls(frame, event, arg):
+            nonlocal calls
+            if event in ("call", "c_call"):
+                calls += 1
+
+        sys.setprofile(count_calls)
+        try:
+            reset = pytest_asyncio.plugin._apply_contextvar_changes(fixture_context)
+        finally:
+            sys.setprofile(None)
+        assert changed_var.get() == "after"
+        assert reset is not None
+        reset()
+        assert changed_var.get() == "before"
+        return calls
+
+    # The number of calls doesn't grow with the number of contextvars
+    assert contextvars.Context().run(apply_fixture_context) < 50
+
+
 def test_no_isolation_against_context_changes_in_sync_tests(pytester: Pytester):
     pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
     pytester.makepyfile(dedent("""
@@ -223,3 +324,51 @@ def test_isolation_against_context_changes_in_async_tests(
             """))
     result = pytester.runpytest("--asyncio-mode=strict")
     result.assert_outcomes(passed=2)
+
+
+def test_var_from_fixture_without_context_propagation_is_not_visible(
+    pytester: Pytester,
+):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(_prelude + dedent("""
+        @pytest_asyncio.fixture(propagate_context=False)
+        async def var_fixture():
+            with context_var_manager("value"):
+                yield
+                assert _context_var.get() == "value"
+
+        @pytest_asyncio.fixture(propagate_context=False)
+        async def other_var_fixture(var_fixture):
+            assert _context_var.get() == "value"
+
+        @pytest.mark.asyncio
+        async def test(other_var_fixture):
+            assert _context_var.get("unset") == "unset"
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+@pytest.mark.parametrize(
+    ("propagate_context", "expected_value"),
+    [("", "unset"), ("propagate_context=True", "value")],
+)
+def test_propagate_fixture_context_configuration(
+    pytester: Pytester, propagate_context: str, expected_value: str
+):
+    pytester.makeini(dedent("""\
+        [pytest]
+        asyncio_default_fixture_loop_scope = function
+        asyncio_propagate_fixture_context = false
+        """))
+    pytester.makepyfile(_prelude + dedent(f"""
+        @pytest_asyncio.fixture({propagate_context})
+        async def var_fixture():
+            _context_var.set("value")
+
+        @pytest.mark.asyncio
+        async def test(var_fixture):
+            assert _context_var.get("unset") == {expected_value!r}
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
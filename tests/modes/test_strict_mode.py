@@ -5,6 +5,8 @@ from textwrap import dedent
 import pytest
 from pytest import Pytester, version_tuple as pytest_version
 
+import pytest_asyncio.plugin
+
 
 def test_strict_mode_cmdline(pytester: Pytester):
     pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
@@ -205,3 +207,40 @@ def test_strict_mode_marked_test_unmarked_autouse_fixture_warning(pytester: Pyte
             ),
         ],
     )
+
+
+def test_strict_mode_parametrized_test_unmarked_fixture_detection(
+    pytester: Pytester,
+):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    items = pytester.getitems(dedent("""\
+        import pytest
+        import pytest_asyncio
+
+        @pytest.fixture()
+        async def unmarked_fixture():
+            pass
+
+        @pytest_asyncio.fixture()
+        async def marked_fixture():
+            pass
+
+        @pytest.mark.asyncio
+        @pytest.mark.parametrize("n", [1, 2])
+        async def test_anything(n, unmarked_fixture, marked_fixture):
+            pass
+        """))
+    key = pytest_asyncio.plugin._unmarked_async_fixtures_key
+    assert [item.stash[key] for item in items] == [
+        ("unmarked_fixture",),
+        ("unmarked_fixture",),
+    ]
+    # The result is cached per fixture definition and shared by both items
+    unmarked_fixturedefs = items[0].config.stash[
+        pytest_asyncio.plugin._unmarked_async_fixturedefs_key
+    ]
+    assert {
+        fixturedef.argname: unmarked
+        for fixturedef, unmarked in unmarked_fixturedefs.items()
+        if fixturedef.argname.endswith("marked_fixture")
+    } == {"unmarked_fixture": True, "marked_fixture": False}
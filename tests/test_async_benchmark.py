@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from textwrap import dedent
+
+from pytest import Pytester
+
+
+def test_async_benchmark_reports_timing_statistics(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+
+            async def yield_twice(result):
+                await asyncio.sleep(0)
+                await asyncio.sleep(0)
+                return result
+
+            @pytest.mark.asyncio
+            async def test_benchmark(async_benchmark):
+                async_benchmark.max_time = 0.05
+                result = await async_benchmark(yield_twice, "done")
+                assert result == "done"
+                stats = async_benchmark.stats
+                assert stats["rounds"] >= 5
+                assert stats["iterations"] >= 1
+                assert 0 < stats["min"] <= stats["median"]
+                assert stats["callbacks_per_iteration"] == 2
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*= asyncio benchmarks =*",
+            "*us min *us median *us stddev * rounds * iterations "
+            "2.0 callbacks/iteration test_async_benchmark_reports_timing_statistics.py"
+            "::test_benchmark",
+        ]
+    )
+
+
+def test_async_benchmark_runs_on_the_loop_of_the_test(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+
+            async def get_loop():
+                return asyncio.get_running_loop()
+
+            @pytest.mark.asyncio(loop_scope="module")
+            async def test_benchmark(async_benchmark):
+                async_benchmark.max_time = 0.01
+                loop = await async_benchmark(get_loop)
+                assert loop is asyncio.get_running_loop()
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+def test_async_benchmark_can_only_be_used_once(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+
+            @pytest.mark.asyncio
+            async def test_benchmark(async_benchmark):
+                async_benchmark.max_time = 0.01
+                await async_benchmark(asyncio.sleep, 0)
+                with pytest.raises(RuntimeError, match="only be used once"):
+                    await async_benchmark(asyncio.sleep, 0)
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
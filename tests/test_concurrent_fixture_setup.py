@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import sys
+from textwrap import dedent
+
+import pytest
+from pytest import Pytester
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (3, 11),
+    reason="Concurrent fixture setup requires Python 3.11 or newer",
+)
+
+
+def test_independent_async_fixtures_are_set_up_concurrently(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_concurrent_fixture_setup = true
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+            import pytest_asyncio
+
+            events = {}
+
+            def get_event(name):
+                return events.setdefault(name, asyncio.Event())
+
+            @pytest_asyncio.fixture
+            async def first():
+                get_event("first").set()
+                await asyncio.wait_for(get_event("second").wait(), timeout=1)
+                yield "first"
+
+            @pytest_asyncio.fixture
+            async def second():
+                get_event("second").set()
+                await asyncio.wait_for(get_event("first").wait(), timeout=1)
+                return "second"
+
+            @pytest.mark.asyncio
+            async def test_uses_both(first, second):
+                assert (first, second) == ("first", "second")
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+def test_async_fixtures_are_set_up_sequentially_by_default(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+            import pytest_asyncio
+
+            running = 0
+
+            async def setup():
+                global running
+                running += 1
+                await asyncio.sleep(0.01)
+                assert running == 1
+                running -= 1
+
+            @pytest_asyncio.fixture
+            async def first():
+                await setup()
+
+            @pytest_asyncio.fixture
+            async def second():
+                await setup()
+
+            @pytest.mark.asyncio
+            async def test_uses_both(first, second):
+                pass
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+def test_dependent_async_fixtures_are_set_up_in_order(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_concurrent_fixture_setup = true
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+            import pytest_asyncio
+
+            @pytest_asyncio.fixture
+            async def base():
+                await asyncio.sleep(0.01)
+                return [1]
+
+            @pytest_asyncio.fixture
+            async def derived(base):
+                return base + [2]
+
+            @pytest_asyncio.fixture
+            async def independent():
+                return 3
+
+            @pytest.mark.asyncio
+            async def test_uses_all(derived, independent):
+                assert derived + [independent] == [1, 2, 3]
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+def test_concurrently_set_up_fixtures_propagate_context_and_teardown(
+    pytester: Pytester,
+):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_concurrent_fixture_setup = true
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            from contextvars import ContextVar
+            import pytest
+            import pytest_asyncio
+
+            first_var = ContextVar("first_var")
+            second_var = ContextVar("second_var")
+            teardowns = []
+
+            @pytest_asyncio.fixture
+            async def first():
+                first_var.set("first")
+                await asyncio.sleep(0)
+                yield
+                teardowns.append("first")
+
+            @pytest_asyncio.fixture
+            async def second():
+                second_var.set("second")
+                await asyncio.sleep(0)
+                yield
+                teardowns.append("second")
+
+            @pytest.mark.asyncio
+            async def test_sees_context(first, second):
+                assert first_var.get() == "first"
+                assert second_var.get() == "second"
+
+            def test_teardown_order():
+                assert teardowns == ["second", "first"]
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=2)
+
+
+def test_error_in_concurrently_set_up_fixture_is_reported(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_concurrent_fixture_setup = true
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+            import pytest_asyncio
+
+            @pytest_asyncio.fixture
+            async def broken():
+                await asyncio.sleep(0)
+                raise RuntimeError("setup failed")
+
+            @pytest_asyncio.fixture
+            async def slow():
+                await asyncio.sleep(0.01)
+                yield
+
+            @pytest.mark.asyncio
+            async def test_uses_both(broken, slow):
+                pass
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(errors=1)
+    result.stdout.fnmatch_lines(["*RuntimeError: setup failed*"])
+
+
+def test_async_fixture_depending_on_async_fixture_through_sync_fixture(
+    pytester: Pytester,
+):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_concurrent_fixture_setup = true
+            """))
+    pytester.makepyfile(dedent("""\
+            import pytest
+            import pytest_asyncio
+
+            calls = []
+
+            @pytest_asyncio.fixture
+            async def b():
+                calls.append("b")
+                yield "b"
+                calls.append("b closed")
+
+            @pytest.fixture
+            def s(b):
+                return b
+
+            @pytest_asyncio.fixture
+            async def a(s):
+                calls.append("a")
+                return "a"
+
+            @pytest_asyncio.fixture
+            async def c():
+                calls.append("c")
+                return "c"
+
+            @pytest.mark.asyncio
+            async def test_uses_all(a, b, c):
+                assert sorted(calls) == ["a", "b", "c"]
+                assert calls.index("b") < calls.index("a")
+
+            def test_b_was_closed_once():
+                assert calls.count("b closed") == 1
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=2)
+
+
+def test_concurrent_fixture_setup_preserves_autouse_order(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_concurrent_fixture_setup = true
+            """))
+    pytester.makepyfile(dedent("""\
+            import pytest
+            import pytest_asyncio
+
+            calls = []
+
+            @pytest.fixture(autouse=True)
+            def autouse():
+                calls.append("autouse")
+
+            @pytest.fixture
+            def sync_dependency():
+                calls.append("sync_dependency")
+
+            @pytest_asyncio.fixture
+            async def first(sync_dependency):
+                pass
+
+            @pytest_asyncio.fixture
+            async def second():
+                pass
+
+            @pytest_asyncio.fixture
+            async def third():
+                pass
+
+            @pytest.mark.asyncio
+            async def test_uses_all(first, second, third):
+                assert calls == ["autouse", "sync_dependency"]
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from textwrap import dedent
+
+from pytest import Pytester
+
+
+def test_async_generator_fixtures_are_torn_down_concurrently(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = module
+            asyncio_concurrent_fixture_teardown = true
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+            import pytest_asyncio
+
+            events = {}
+
+            def get_event(name):
+                return events.setdefault(name, asyncio.Event())
+
+            @pytest_asyncio.fixture(scope="module")
+            async def first():
+                yield
+                get_event("first").set()
+                await asyncio.wait_for(get_event("second").wait(), timeout=1)
+
+            @pytest_asyncio.fixture(scope="module")
+            async def second():
+                yield
+                get_event("second").set()
+                await asyncio.wait_for(get_event("first").wait(), timeout=1)
+
+            @pytest.mark.asyncio(loop_scope="module")
+            async def test_uses_both(first, second):
+                pass
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+def test_dependent_fixtures_are_torn_down_in_order(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_concurrent_fixture_teardown = true
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+            import pytest_asyncio
+
+            teardowns = []
+
+            @pytest.fixture
+            def resource():
+                yield
+                teardowns.append("resource")
+
+            @pytest_asyncio.fixture
+            async def base(resource):
+                yield
+                await asyncio.sleep(0.01)
+                teardowns.append("base")
+
+            @pytest_asyncio.fixture
+            async def derived(base):
+                yield
+                await asyncio.sleep(0.01)
+                teardowns.append("derived")
+
+            @pytest.mark.asyncio
+            async def test_uses_derived(derived):
+                pass
+
+            def test_teardown_order():
+                assert teardowns == ["derived", "base", "resource"]
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=2)
+
+
+def test_function_scoped_fixtures_are_torn_down_with_their_test(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = module
+            asyncio_concurrent_fixture_teardown = true
+            """))
+    pytester.makepyfile(dedent("""\
+            import pytest
+            import pytest_asyncio
+
+            teardowns = []
+
+            @pytest_asyncio.fixture
+            async def first():
+                yield
+                teardowns.append("first")
+
+            @pytest_asyncio.fixture
+            async def second():
+                yield
+                teardowns.append("second")
+
+            @pytest.mark.asyncio(loop_scope="module")
+            async def test_uses_both(first, second):
+                pass
+
+            def test_fixtures_were_torn_down():
+                assert sorted(teardowns) == ["first", "second"]
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=2)
+
+
+def test_teardown_errors_are_aggregated(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_concurrent_fixture_teardown = true
+            """))
+    pytester.makepyfile(dedent("""\
+            import pytest
+            import pytest_asyncio
+
+            @pytest_asyncio.fixture
+            async def first():
+                yield
+                raise RuntimeError("first failed")
+
+            @pytest_asyncio.fixture
+            async def second():
+                yield
+                raise RuntimeError("second failed")
+
+            @pytest.mark.asyncio
+            async def test_uses_both(first, second):
+                pass
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1, errors=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*errors while tearing down async generator fixtures*",
+            "*RuntimeError: *failed*",
+        ]
+    )
+
+
+def test_deferred_teardowns_register_batch_once_per_dependency(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = module
+            asyncio_concurrent_fixture_teardown = true
+            """))
+    pytester.makepyfile(dedent("""\
+            import pytest
+            import pytest_asyncio
+
+            finalizer_counts = []
+
+            @pytest.fixture(scope="module")
+            def dependency():
+                return None
+
+            @pytest_asyncio.fixture
+            async def fixture(dependency):
+                yield
+
+            @pytest.mark.parametrize("n", range(10))
+            @pytest.mark.asyncio(loop_scope="module")
+            async def test_defers_teardown(n, fixture, request):
+                fixturedef = request._get_active_fixturedef("dependency")
+                finalizer_counts.append(len(fixturedef._finalizers))
+
+            def test_finalizers_grow_by_one_per_test():
+                # pytest itself registers the teardown of each dependent fixture
+                growth = finalizer_counts[-1] - finalizer_counts[1]
+                assert growth == len(finalizer_counts) - 2
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=11)
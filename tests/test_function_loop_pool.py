@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from textwrap import dedent
+
+from pytest import Pytester
+
+
+def test_function_scoped_loops_are_reused(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_function_loop_pool = true
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+
+            loops = []
+
+            @pytest.mark.asyncio
+            async def test_first():
+                loops.append(asyncio.get_running_loop())
+
+            @pytest.mark.asyncio
+            async def test_second():
+                loops.append(asyncio.get_running_loop())
+                assert loops[0] is loops[1]
+                assert asyncio.get_event_loop() is loops[1]
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=2)
+
+
+def test_function_scoped_loops_are_not_reused_by_default(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+
+            loops = []
+
+            @pytest.mark.asyncio
+            async def test_first():
+                loops.append(asyncio.get_running_loop())
+
+            @pytest.mark.asyncio
+            async def test_second():
+                loops.append(asyncio.get_running_loop())
+                assert loops[0] is not loops[1]
+                assert loops[0].is_closed()
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=2)
+
+
+def test_reused_loop_is_reset_between_tests(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_function_loop_pool = true
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+
+            loops = []
+            cancelled = []
+
+            async def run_forever():
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(True)
+                    raise
+
+            async def agen():
+                yield 1
+                yield 2
+
+            @pytest.mark.asyncio
+            async def test_changes_loop_state():
+                loop = asyncio.get_running_loop()
+                loops.append(loop)
+                loop.set_exception_handler(lambda loop, context: None)
+                loop.slow_callback_duration = 10
+                await loop.run_in_executor(None, lambda: None)
+                asyncio.create_task(run_forever())
+                gen = agen()
+                await gen.__anext__()
+                await asyncio.sleep(0)
+
+            @pytest.mark.asyncio
+            async def test_sees_reset_loop():
+                loop = asyncio.get_running_loop()
+                assert loop is loops[0]
+                assert cancelled == [True]
+                assert loop.get_exception_handler() is None
+                assert loop.slow_callback_duration == 0.1
+                assert asyncio.all_tasks(loop) == {asyncio.current_task()}
+                assert await loop.run_in_executor(None, lambda: 42) == 42
+                assert [value async for value in agen()] == [1, 2]
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=2)
+
+
+def test_loop_with_leftover_readers_is_not_reused(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_function_loop_pool = true
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import socket
+            import pytest
+
+            loops = []
+            sockets = []
+
+            @pytest.mark.asyncio
+            async def test_leaves_reader_registered():
+                loop = asyncio.get_running_loop()
+                loops.append(loop)
+                sockets.extend(socket.socketpair())
+                loop.add_reader(sockets[0], lambda: None)
+
+            @pytest.mark.asyncio
+            async def test_gets_fresh_loop():
+                assert asyncio.get_running_loop() is not loops[0]
+                assert loops[0].is_closed()
+                for sock in sockets:
+                    sock.close()
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=2)
+
+
+def test_reused_virtual_time_loop_starts_at_zero(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_function_loop_pool = true
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+
+            loops = []
+
+            @pytest.mark.asyncio(loop_factories=["virtual_time"])
+            async def test_advances_clock():
+                loops.append(asyncio.get_running_loop())
+                await asyncio.sleep(3600)
+
+            @pytest.mark.asyncio(loop_factories=["virtual_time"])
+            async def test_sees_reset_clock():
+                loop = asyncio.get_running_loop()
+                assert loop is loops[0]
+                assert loop.time() == 0
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=2)
+
+
+def test_loops_of_unknown_types_are_not_reused(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_function_loop_pool = true
+            """))
+    pytester.makeconftest(dedent("""\
+            import asyncio
+
+            class CustomEventLoop(asyncio.SelectorEventLoop):
+                pass
+
+            def pytest_asyncio_loop_factories(config, item):
+                return {"custom": CustomEventLoop}
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+
+            loops = []
+
+            @pytest.mark.asyncio
+            async def test_first():
+                loops.append(asyncio.get_running_loop())
+
+            @pytest.mark.asyncio
+            async def test_second():
+                assert asyncio.get_running_loop() is not loops[0]
+                assert loops[0].is_closed()
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=2)
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from textwrap import dedent
+
+from pytest import Pytester
+
+_TEST_MODULE = dedent("""\
+    import pytest
+
+    @pytest.fixture
+    def sync_fixture():
+        return 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.custom
+    @pytest.mark.parametrize("n", [1, 2])
+    async def test_coroutine(n, sync_fixture):
+        assert n == 1
+    """)
+
+_CHECK_ITEMS_CONFTEST = dedent("""\
+    import pytest
+    from pytest_asyncio.plugin import Coroutine
+
+    def pytest_configure(config):
+        config.addinivalue_line("markers", "custom: a custom marker")
+
+    def pytest_collection_modifyitems(items):
+        for item in items:
+            assert type(item) is Coroutine
+            assert item.nodeid.startswith("test_items.py::test_coroutine[")
+            assert item.get_closest_marker("asyncio") is not None
+            assert item.get_closest_marker("custom") is not None
+            assert item.get_closest_marker("parametrize") is not None
+            assert "custom" in item.keywords
+            assert item.name in item.keywords
+            assert {"n", "sync_fixture"} <= set(item.fixturenames)
+            assert item._fixtureinfo.argnames == ("n", "sync_fixture")
+            assert item.callspec.params["n"] in (1, 2)
+    """)
+
+
+def test_converted_items_keep_their_attributes(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makeconftest(_CHECK_ITEMS_CONFTEST)
+    pytester.makepyfile(test_items=_TEST_MODULE)
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1, failed=1)
+
+
+def test_converted_items_are_listed_by_collect_only(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makeconftest(_CHECK_ITEMS_CONFTEST)
+    pytester.makepyfile(test_items=_TEST_MODULE)
+    result = pytester.runpytest("--asyncio-mode=strict", "--collect-only")
+    result.assert_outcomes()
+    result.stdout.fnmatch_lines(
+        ["*<Coroutine test_coroutine[[]1[]]>", "*<Coroutine test_coroutine[[]2[]]>"]
+    )
+
+
+def test_converted_items_are_rerun_by_last_failed(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makeconftest(_CHECK_ITEMS_CONFTEST)
+    pytester.makepyfile(test_items=_TEST_MODULE)
+    result = pytester.runpytest("--asyncio-mode=strict", "-p", "cacheprovider")
+    result.assert_outcomes(passed=1, failed=1)
+    result = pytester.runpytest("--asyncio-mode=strict", "-p", "cacheprovider", "--lf")
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "run-last-failure: rerun previous 1 failure*",
+            "*FAILED test_items.py::test_coroutine[[]2[]]*",
+        ]
+    )
+
+
+def test_items_of_function_subclasses_are_converted(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makeconftest(dedent("""\
+        import pytest
+        from pytest_asyncio.plugin import Coroutine
+
+        # The slot changes the layout of the items, so their class can't be
+        # swapped for a PytestAsyncioFunction subclass
+        class CustomFunction(pytest.Function):
+            __slots__ = ("extra",)
+
+        @pytest.hookimpl(tryfirst=True)
+        def pytest_pycollect_makeitem(collector, name, obj):
+            if name == "test_coroutine":
+                return list(
+                    CustomFunction.from_parent(
+                        collector,
+                        name=item.name,
+                        callspec=item.callspec,
+                        callobj=item.obj,
+                        fixtureinfo=item._fixtureinfo,
+                        keywords=item.keywords,
+                        originalname=item.originalname,
+                    )
+                    for item in collector._genfunctions(name, obj)
+                )
+
+        """) + _CHECK_ITEMS_CONFTEST)
+    pytester.makepyfile(test_items=_TEST_MODULE)
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1, failed=1)
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from textwrap import dedent
+
+from pytest import Pytester
+
+
+def test_no_loop_is_created_for_tests_that_do_not_run(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makeconftest(dedent("""\
+        import asyncio
+
+        created_loops = []
+
+        def create_loop():
+            created_loops.append(None)
+            return asyncio.new_event_loop()
+
+        def pytest_asyncio_loop_factories(config, item):
+            return {"counting": create_loop}
+        """))
+    pytester.makepyfile(dedent("""\
+        import pytest
+
+        pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+        @pytest.fixture
+        def skipping_fixture():
+            pytest.skip("skipped by fixture")
+
+        @pytest.mark.skip(reason="skipped")
+        async def test_skipped():
+            pass
+
+        @pytest.mark.xfail(run=False, reason="not run")
+        async def test_not_run():
+            pass
+
+        async def test_skipped_by_fixture(skipping_fixture):
+            pass
+        """))
+    pytester.makepyfile(test_z_check=dedent("""\
+        from conftest import created_loops
+
+        def test_no_loop_was_created():
+            assert created_loops == []
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1, skipped=2, xfailed=1)
+
+
+def test_loop_is_created_when_coroutine_runs(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makeconftest(dedent("""\
+        import asyncio
+
+        created_loops = []
+
+        def create_loop():
+            loop = asyncio.new_event_loop()
+            created_loops.append(loop)
+            return loop
+
+        def pytest_asyncio_loop_factories(config, item):
+            return {"counting": create_loop}
+        """))
+    pytester.makepyfile(dedent("""\
+        import asyncio
+        import pytest
+        from conftest import created_loops
+
+        pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+        async def test_first():
+            assert created_loops == [asyncio.get_running_loop()]
+            assert asyncio.get_event_loop() is created_loops[0]
+
+        async def test_second():
+            assert created_loops == [asyncio.get_running_loop()]
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=2)
+
+
+def test_no_loop_is_created_when_only_fixtures_are_set_up(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makeconftest(dedent("""\
+        import asyncio
+
+        created_loops = []
+
+        def create_loop():
+            created_loops.append(None)
+            return asyncio.new_event_loop()
+
+        def pytest_asyncio_loop_factories(config, item):
+            return {"counting": create_loop}
+
+        def pytest_unconfigure(config):
+            print(f"created loops: {len(created_loops)}")
+        """))
+    pytester.makepyfile(dedent("""\
+        import pytest
+
+        @pytest.fixture
+        def sync_fixture():
+            return 1
+
+        @pytest.mark.asyncio
+        async def test_first(sync_fixture):
+            pass
+
+        @pytest.mark.asyncio(loop_scope="module")
+        async def test_second(sync_fixture):
+            pass
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict", "--setup-only", "-s")
+    result.stdout.fnmatch_lines(["created loops: 0"])
+
+
+def test_sync_asyncio_fixture_without_asyncio_does_not_create_the_loop(
+    pytester: Pytester,
+):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makeconftest(dedent("""\
+        import asyncio
+
+        created_loops = []
+
+        def create_loop():
+            created_loops.append(None)
+            return asyncio.new_event_loop()
+
+        def pytest_asyncio_loop_factories(config, item):
+            return {"counting": create_loop}
+
+        def pytest_unconfigure(config):
+            print(f"created loops: {len(created_loops)}")
+        """))
+    pytester.makepyfile(dedent("""\
+        import pytest
+        import pytest_asyncio
+
+        @pytest_asyncio.fixture
+        def sync_fixture():
+            return 1
+
+        @pytest_asyncio.fixture
+        def sync_gen_fixture():
+            yield 1
+
+        @pytest.mark.asyncio
+        async def test_uses_sync_fixtures(sync_fixture, sync_gen_fixture):
+            pass
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict", "--setup-only", "-s")
+    result.stdout.fnmatch_lines(["created loops: 0"])
+
+
+def test_sync_asyncio_fixture_creates_the_loop_on_access(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makeconftest(dedent("""\
+        import asyncio
+
+        created_loops = []
+
+        def create_loop():
+            loop = asyncio.new_event_loop()
+            created_loops.append(loop)
+            return loop
+
+        def pytest_asyncio_loop_factories(config, item):
+            return {"counting": create_loop}
+        """))
+    pytester.makepyfile(dedent("""\
+        import asyncio
+        import pytest
+        import pytest_asyncio
+        from conftest import created_loops
+
+        @pytest_asyncio.fixture
+        def sync_fixture():
+            assert created_loops == []
+            loop = asyncio.get_event_loop()
+            assert created_loops == [loop]
+            return loop
+
+        @pytest_asyncio.fixture
+        def sync_gen_fixture(sync_fixture):
+            assert asyncio.get_event_loop() is sync_fixture
+            yield
+            assert asyncio.get_event_loop() is sync_fixture
+
+        @pytest.mark.asyncio
+        async def test_runs_in_fixture_loop(sync_fixture, sync_gen_fixture):
+            assert asyncio.get_running_loop() is sync_fixture
+            assert created_loops == [sync_fixture]
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
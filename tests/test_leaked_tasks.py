@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from textwrap import dedent
+
+from pytest import Pytester
+
+
+def test_leaked_tasks_are_ignored_by_default(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+
+            @pytest.mark.asyncio
+            async def test_leaks_task():
+                asyncio.create_task(asyncio.sleep(10))
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1, warnings=0)
+
+
+def test_warns_about_tasks_leaked_by_test(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_leaked_tasks = warn
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+
+            @pytest.mark.asyncio(loop_scope="module")
+            async def test_leaks_tasks():
+                asyncio.create_task(asyncio.sleep(10), name="first_leak")
+                asyncio.create_task(asyncio.sleep(10), name="second_leak")
+
+            @pytest.mark.asyncio(loop_scope="module")
+            async def test_cleans_up():
+                await asyncio.create_task(asyncio.sleep(0))
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict", "-W", "default")
+    result.assert_outcomes(passed=2, warnings=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*RuntimeWarning: 2 task(s) created by "
+            "test_warns_about_tasks_leaked_by_test.py::test_leaks_tasks "
+            "are still pending after the test finished:",
+            "*<Task pending name='first_leak'*",
+            "*<Task pending name='second_leak'*",
+        ]
+    )
+
+
+def test_fails_test_that_leaks_tasks_in_error_mode(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_leaked_tasks = error
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+
+            @pytest.mark.asyncio
+            async def test_leaks_task():
+                asyncio.create_task(asyncio.sleep(10))
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(["*1 task(s) created by *::test_leaks_task*"])
+
+
+def test_reports_creation_stack_in_debug_mode(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_leaked_tasks = error
+            asyncio_debug = true
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+
+            def start_background_task():
+                asyncio.create_task(asyncio.sleep(10))
+
+            @pytest.mark.asyncio
+            async def test_leaks_task():
+                start_background_task()
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*Created at (most recent call last):",
+            "*in start_background_task",
+        ]
+    )
+
+
+def test_warns_about_tasks_pending_when_loop_is_closed(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = module
+            asyncio_leaked_tasks = warn
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+            import pytest_asyncio
+
+            @pytest_asyncio.fixture(scope="module")
+            async def background_task():
+                return asyncio.create_task(asyncio.sleep(10), name="background")
+
+            @pytest.mark.asyncio(loop_scope="module")
+            async def test_uses_background_task(background_task):
+                pass
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict", "-W", "default")
+    result.assert_outcomes(passed=1, warnings=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*RuntimeWarning: 1 task(s) are still pending when the module-scoped "
+            "event loop is closed:",
+            "*<Task pending name='background'*",
+        ]
+    )
+
+
+def test_invalid_leaked_tasks_mode_raises_usage_error(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_leaked_tasks = sometimes
+            """))
+    pytester.makepyfile(dedent("""\
+            async def test_anything():
+                pass
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.stderr.fnmatch_lines(["*'sometimes' is not a valid asyncio_leaked_tasks*"])
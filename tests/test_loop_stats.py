@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+from textwrap import dedent
+
+from pytest import Pytester
+
+
+def test_loop_stats_are_disabled_by_default(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+        import asyncio
+        import pytest
+
+        @pytest.mark.asyncio
+        async def test_sleeps():
+            await asyncio.sleep(0)
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+    result.stdout.no_fnmatch_line("*asyncio event loop stats*")
+
+
+def test_loop_stats_report_blocking_callbacks(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+        import asyncio
+        import time
+
+        import pytest
+
+        @pytest.mark.asyncio
+        async def test_blocks_loop():
+            time.sleep(0.2)
+            await asyncio.sleep(0)
+
+        @pytest.mark.asyncio
+        async def test_does_not_block_loop():
+            await asyncio.sleep(0)
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict", "--asyncio-loop-stats")
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(
+        [
+            "*asyncio event loop stats (slowest 10)*",
+            "0.2*s blocked 0.2*s longest callback * test_loop_stats_report_blocking_"
+            "callbacks.py::test_blocks_loop",
+            "0.000s blocked * test_loop_stats_report_blocking_callbacks.py::"
+            "test_does_not_block_loop",
+        ]
+    )
+
+
+def test_loop_stats_record_timer_lag(pytester: Pytester):
+    pytester.makeini(dedent("""\
+        [pytest]
+        asyncio_default_fixture_loop_scope = function
+        asyncio_loop_stats = true
+        """))
+    pytester.makepyfile(dedent("""\
+        import asyncio
+        import time
+
+        import pytest
+
+        async def block():
+            time.sleep(0.2)
+
+        @pytest.mark.asyncio
+        async def test_timer_is_late():
+            blocker = asyncio.create_task(block())
+            await asyncio.sleep(0.01)
+            await blocker
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+    # The timer is due 0.01s after the blocking callback starts, but a busy
+    # machine may delay the callback further
+    result.stdout.fnmatch_lines(["* 0.[12]*s max lag *::test_timer_is_late"])
+
+
+def test_loop_stats_are_attached_to_report(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makeconftest(dedent("""\
+        def pytest_runtest_logreport(report):
+            if report.when == "teardown":
+                stats = dict(report.user_properties)["asyncio_loop_stats"]
+                assert stats["callbacks"] > 0
+                assert set(stats) == {
+                    "callbacks", "longest_callback", "blocked_time", "max_lag"
+                }
+                print("STATS-CHECKED")
+        """))
+    pytester.makepyfile(dedent("""\
+        import asyncio
+        import pytest
+
+        @pytest.mark.asyncio
+        async def test_sleeps():
+            await asyncio.sleep(0)
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict", "--asyncio-loop-stats", "-s")
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["*STATS-CHECKED*"])
+
+
+def test_loop_stats_instrument_callbacks_only_while_loops_are_observed(
+    pytester: Pytester,
+):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+        import asyncio
+        import pytest
+
+        uninstrumented_handle_run = asyncio.Handle._run
+
+        @pytest.mark.asyncio
+        async def test_instrumented():
+            assert asyncio.Handle._run is not uninstrumented_handle_run
+
+        def test_not_instrumented():
+            assert asyncio.Handle._run is uninstrumented_handle_run
+        """))
+    handle_run = asyncio.Handle._run  # type: ignore[attr-defined]
+    result = pytester.runpytest("--asyncio-mode=strict", "--asyncio-loop-stats")
+    result.assert_outcomes(passed=2)
+    assert asyncio.Handle._run is handle_run  # type: ignore[attr-defined]
+
+
+def test_loop_stats_record_callbacks_of_loop_threads(pytester: Pytester):
+    pytester.makeini(dedent("""\
+        [pytest]
+        asyncio_default_fixture_loop_scope = function
+        asyncio_loop_thread = true
+        """))
+    pytester.makeconftest(dedent("""\
+        def pytest_runtest_logreport(report):
+            if report.when == "teardown":
+                stats = dict(report.user_properties)["asyncio_loop_stats"]
+                assert stats["callbacks"] > 0
+                print("STATS-CHECKED")
+        """))
+    pytester.makepyfile(dedent("""\
+        import asyncio
+        import pytest
+
+        @pytest.mark.asyncio(loop_scope="module")
+        async def test_sleeps():
+            await asyncio.sleep(0)
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict", "--asyncio-loop-stats", "-s")
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["*STATS-CHECKED*"])
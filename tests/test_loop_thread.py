@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import sys
+from textwrap import dedent
+
+import pytest
+from pytest import Pytester
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (3, 11),
+    reason="Running event loops on a dedicated thread requires Python 3.11 or newer",
+)
+
+
+def test_coroutines_run_on_loop_thread(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_loop_thread = true
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import threading
+            import pytest
+            import pytest_asyncio
+
+            @pytest_asyncio.fixture(loop_scope="module", scope="module")
+            async def fixture_thread():
+                return threading.current_thread()
+
+            @pytest.mark.asyncio(loop_scope="module")
+            async def test_runs_on_loop_thread(fixture_thread):
+                assert threading.current_thread() is fixture_thread
+                assert fixture_thread.name == "pytest-asyncio-module-loop"
+                assert fixture_thread is not threading.main_thread()
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+def test_background_tasks_run_between_tests(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_loop_thread = true
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import threading
+            import pytest
+            import pytest_asyncio
+
+            heartbeat = threading.Event()
+
+            @pytest_asyncio.fixture(loop_scope="module", scope="module")
+            async def background_task():
+                async def beat():
+                    await asyncio.sleep(0.1)
+                    heartbeat.set()
+
+                task = asyncio.create_task(beat())
+                yield
+                await task
+
+            @pytest.mark.asyncio(loop_scope="module")
+            async def test_start(background_task):
+                assert not heartbeat.is_set()
+
+            def test_task_progresses_while_no_coroutine_runs():
+                assert heartbeat.wait(timeout=5)
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=2)
+
+
+def test_context_variables_propagate_from_fixtures(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_loop_thread = true
+            """))
+    pytester.makepyfile(dedent("""\
+            from contextvars import ContextVar
+            import pytest
+            import pytest_asyncio
+
+            var = ContextVar("var")
+
+            @pytest_asyncio.fixture
+            async def set_var():
+                var.set("value")
+                yield
+
+            @pytest.mark.asyncio
+            async def test_sees_var(set_var):
+                assert var.get() == "value"
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+def test_failures_and_skips_are_reported(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_loop_thread = true
+            """))
+    pytester.makepyfile(dedent("""\
+            import pytest
+
+            @pytest.mark.asyncio
+            async def test_fails():
+                assert 1 == 2
+
+            @pytest.mark.asyncio
+            async def test_skips():
+                pytest.skip("skipped")
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(failed=1, skipped=1)
+
+
+def test_loop_thread_stops_when_loop_is_torn_down(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_loop_thread = true
+            """))
+    pytester.makeconftest("loop_threads = []")
+    pytester.makepyfile(
+        test_a=dedent("""\
+            import threading
+            import pytest
+            from conftest import loop_threads
+
+            @pytest.mark.asyncio(loop_scope="module")
+            async def test_first():
+                loop_threads.append(threading.current_thread())
+            """),
+        test_b=dedent("""\
+            from conftest import loop_threads
+
+            def test_thread_has_stopped():
+                loop_threads[0].join(timeout=5)
+                assert not loop_threads[0].is_alive()
+            """),
+    )
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=2)
+
+
+def test_function_scoped_loops_run_on_calling_thread(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_loop_thread = true
+            asyncio_function_loop_pool = true
+            """))
+    pytester.makepyfile(dedent("""\
+            import threading
+            import pytest
+
+            @pytest.mark.asyncio
+            async def test_function_scoped_loop():
+                assert threading.current_thread() is threading.main_thread()
+
+            @pytest.mark.asyncio(loop_scope="module")
+            async def test_module_scoped_loop():
+                assert threading.current_thread() is not threading.main_thread()
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=2)
+
+
+def test_background_tasks_are_not_reported_as_leaked(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_loop_thread = true
+            asyncio_leaked_tasks = error
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+
+            pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+            tasks = []
+
+            async def test_starts_background_task():
+                tasks.append(asyncio.create_task(asyncio.sleep(0.1)))
+
+            async def test_awaits_background_task():
+                await tasks[0]
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=2)
+
+
+def test_pending_tasks_are_collected_on_loop_thread(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_loop_thread = true
+            asyncio_leaked_tasks = warn
+            """))
+    pytester.makeconftest(dedent("""\
+            import threading
+            import pytest
+            import pytest_asyncio.plugin
+
+            collecting_threads = []
+
+            @pytest.fixture(scope="session", autouse=True)
+            def record_collecting_threads():
+                unreported_pending_tasks = (
+                    pytest_asyncio.plugin._unreported_pending_tasks
+                )
+
+                def record(config, loop):
+                    collecting_threads.append(threading.current_thread().name)
+                    return unreported_pending_tasks(config, loop)
+
+                with pytest.MonkeyPatch.context() as mp:
+                    mp.setattr(
+                        pytest_asyncio.plugin, "_unreported_pending_tasks", record
+                    )
+                    yield
+            """))
+    pytester.makepyfile(
+        test_a=dedent("""\
+            import asyncio
+            import pytest
+
+            @pytest.mark.asyncio(loop_scope="module")
+            async def test_leaves_task_pending():
+                asyncio.create_task(asyncio.sleep(10), name="pending-task")
+            """),
+        test_b=dedent("""\
+            from conftest import collecting_threads
+
+            def test_collected_on_loop_thread():
+                assert collecting_threads == ["pytest-asyncio-module-loop"]
+            """),
+    )
+    result = pytester.runpytest("--asyncio-mode=strict", "-W", "default")
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(["*1 task(s) are still pending*", "*pending-task*"])
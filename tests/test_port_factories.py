@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import json
+import os
+import socket
+import subprocess
+import sys
 from textwrap import dedent
 
+import pytest
 from pytest import Pytester
 
 import pytest_asyncio.plugin
@@ -181,3 +187,281 @@ def test_unused_udp_port_factory_duplicate(unused_udp_port_factory, monkeypatch)
 
     assert unused_udp_port_factory() == 10000
     assert unused_udp_port_factory() > 10000
+
+
+def test_port_registry_hands_out_disjoint_ports(tmp_path):
+    path = tmp_path / "ports.json"
+    first = pytest_asyncio.plugin._PortRegistry(path, "gw0")
+    second = pytest_asyncio.plugin._PortRegistry(path, "gw1")
+
+    assert first.lease(socket.SOCK_STREAM, 10000)
+    assert not second.lease(socket.SOCK_STREAM, 10000)
+    assert second.lease(socket.SOCK_DGRAM, 10000)
+
+    first.release()
+
+    assert second.lease(socket.SOCK_STREAM, 10000)
+
+
+def test_unused_port_factory_skips_ports_leased_by_other_workers(
+    pytester: Pytester, monkeypatch
+):
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw1")
+    # Mirror the layout of pytest-xdist, whose workers use subdirectories
+    # of a shared base temporary directory
+    shared_dir = pytester.mkdir("basetemp")
+    registry_path = shared_dir / "pytest-asyncio-ports.json"
+    registry = pytest_asyncio.plugin._PortRegistry(registry_path, "gw0")
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+            import pytest_asyncio.plugin
+
+            def test_leased_port_is_skipped(unused_tcp_port_factory, monkeypatch):
+                ports = iter([10000, 10001])
+                monkeypatch.setattr(
+                    pytest_asyncio.plugin, "_unused_port", lambda _: next(ports)
+                )
+                assert unused_tcp_port_factory() == 10001
+            """))
+    assert registry.lease(socket.SOCK_STREAM, 10000)
+
+    result = pytester.runpytest(f"--basetemp={shared_dir / 'popen-gw1'}")
+    result.assert_outcomes(passed=1)
+    leases = json.loads(registry_path.read_text())
+    assert leases == {f"{socket.SOCK_STREAM}:10000": "gw0"}
+
+
+def test_unused_port_releases_its_lease_after_the_test(pytester: Pytester, monkeypatch):
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw1")
+    shared_dir = pytester.mkdir("basetemp")
+    registry_path = shared_dir / "pytest-asyncio-ports.json"
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent(f"""\
+            import json
+            import socket
+            from pathlib import Path
+
+            def test_port_is_leased(unused_tcp_port):
+                leases = json.loads(Path({str(registry_path)!r}).read_text())
+                assert f"{{socket.SOCK_STREAM}}:{{unused_tcp_port}}" in leases
+
+            def test_lease_is_released():
+                assert json.loads(Path({str(registry_path)!r}).read_text()) == {{}}
+            """))
+
+    result = pytester.runpytest(f"--basetemp={shared_dir / 'popen-gw1'}")
+    result.assert_outcomes(passed=2)
+
+
+def test_unused_port_gives_up_when_all_ports_are_leased(tmp_path, monkeypatch):
+    path = tmp_path / "ports.json"
+    other_worker = pytest_asyncio.plugin._PortRegistry(path, "gw0")
+    assert other_worker.lease(socket.SOCK_STREAM, 10000)
+    monkeypatch.setattr(pytest_asyncio.plugin, "_unused_port", lambda _: 10000)
+    registry = pytest_asyncio.plugin._PortRegistry(path, "gw1")
+
+    with pytest.raises(RuntimeError, match="Could not find an unused port"):
+        pytest_asyncio.plugin._unused_leased_port(socket.SOCK_STREAM, registry)
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="Liveness of owners isn't checked on Windows"
+)
+def test_port_registry_drops_leases_of_exited_workers(tmp_path):
+    exited_process = subprocess.Popen([sys.executable, "-c", "pass"])
+    exited_process.wait()
+    path = tmp_path / "ports.json"
+    exited_worker = pytest_asyncio.plugin._PortRegistry(
+        path, f"gw0:{exited_process.pid}"
+    )
+    running_worker = pytest_asyncio.plugin._PortRegistry(path, f"gw1:{os.getpid()}")
+    assert exited_worker.lease(socket.SOCK_STREAM, 10000)
+    assert running_worker.lease(socket.SOCK_STREAM, 10001)
+
+    running_worker.drop_stale_leases()
+
+    leases = json.loads(path.read_text())
+    assert leases == {f"{socket.SOCK_STREAM}:10001": f"gw1:{os.getpid()}"}
+
+
+def test_unused_tcp_socket_can_be_passed_to_start_server(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+            import asyncio
+
+            import pytest
+
+            @pytest.mark.asyncio
+            async def test_server_uses_socket(unused_tcp_socket):
+                async def echo(reader, writer):
+                    writer.write(await reader.read(5))
+                    await writer.drain()
+                    writer.close()
+
+                host, port = unused_tcp_socket.getsockname()
+                server = await asyncio.start_server(echo, sock=unused_tcp_socket)
+                async with server:
+                    reader, writer = await asyncio.open_connection(host, port)
+                    writer.write(b"hello")
+                    assert await reader.read() == b"hello"
+                    writer.close()
+                    await writer.wait_closed()
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+def test_unused_udp_socket_can_be_passed_to_datagram_endpoint(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+            import asyncio
+
+            import pytest
+
+            @pytest.mark.asyncio
+            async def test_endpoint_uses_socket(unused_udp_socket):
+                loop = asyncio.get_running_loop()
+                address = unused_udp_socket.getsockname()
+                transport, _ = await loop.create_datagram_endpoint(
+                    asyncio.DatagramProtocol, sock=unused_udp_socket
+                )
+                assert transport.get_extra_info("sockname") == address
+                transport.close()
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+def test_unused_socket_factories_produce_distinct_bound_sockets(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+            import socket
+
+            sockets = []
+
+            def test_distinct_sockets(
+                unused_tcp_socket_factory, unused_udp_socket_factory
+            ):
+                sockets.extend(unused_tcp_socket_factory() for _ in range(3))
+                sockets.extend(unused_udp_socket_factory() for _ in range(3))
+                ports = {sock.getsockname()[1] for sock in sockets[:3]}
+                assert len(ports) == 3
+                ports = {sock.getsockname()[1] for sock in sockets[3:]}
+                assert len(ports) == 3
+
+            def test_listening_socket_accepts_connections(unused_tcp_socket_factory):
+                sock = unused_tcp_socket_factory(listen=True)
+                with socket.create_connection(sock.getsockname(), timeout=1):
+                    pass
+
+            def test_sockets_are_closed_after_the_test():
+                assert all(sock.fileno() == -1 for sock in sockets)
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=3)
+
+
+def test_unused_port_factory_many_returns_distinct_ports(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+            def test_many_ports(unused_tcp_port_factory, unused_udp_port_factory):
+                single_port = unused_tcp_port_factory()
+                tcp_ports = unused_tcp_port_factory.many(20)
+                assert len(set(tcp_ports)) == 20
+                assert single_port not in tcp_ports
+                assert unused_tcp_port_factory() not in tcp_ports
+                udp_ports = unused_udp_port_factory.many(20)
+                assert len(set(udp_ports)) == 20
+                assert unused_tcp_port_factory.many(0) == []
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+def test_unused_port_factory_many_returns_contiguous_ports(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+            import socket
+
+            def test_contiguous_ports(unused_tcp_port_factory):
+                ports = unused_tcp_port_factory.many(5, contiguous=True)
+                assert ports == list(range(ports[0], ports[0] + 5))
+                for port in ports:
+                    with socket.socket() as sock:
+                        sock.bind(("127.0.0.1", port))
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+def test_unused_port_factory_many_skips_leased_ports(tmp_path):
+    path = tmp_path / "ports.json"
+    other_worker = pytest_asyncio.plugin._PortRegistry(path, "gw0")
+    factory = pytest_asyncio.UnusedPortFactory(
+        socket.SOCK_STREAM, pytest_asyncio.plugin._PortRegistry(path, "gw1")
+    )
+    ports = factory.many(10)
+    assert other_worker.lease_many(socket.SOCK_STREAM, ports) == []
+    contiguous_ports = factory.many(3, contiguous=True)
+    assert not set(ports) & set(contiguous_ports)
+    assert other_worker.lease_many(socket.SOCK_STREAM, contiguous_ports) == []
+
+
+@pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets are not supported"
+)
+def test_unused_unix_socket_path_can_be_served(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import os
+
+            import pytest
+
+            @pytest.mark.asyncio
+            async def test_serve_on_path(unused_unix_socket_path):
+                assert len(os.fsencode(unused_unix_socket_path)) < 104
+                assert not os.path.exists(unused_unix_socket_path)
+
+                async def echo(reader, writer):
+                    writer.write(await reader.read(5))
+                    await writer.drain()
+                    writer.close()
+
+                server = await asyncio.start_unix_server(
+                    echo, path=unused_unix_socket_path
+                )
+                async with server:
+                    reader, writer = await asyncio.open_unix_connection(
+                        unused_unix_socket_path
+                    )
+                    writer.write(b"hello")
+                    assert await reader.read() == b"hello"
+                    writer.close()
+                    await writer.wait_closed()
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+@pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets are not supported"
+)
+def test_unix_socket_path_factory_cleans_up_at_session_end(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+            import os
+            import socket
+
+            def test_distinct_paths(unix_socket_path_factory):
+                paths = [unix_socket_path_factory() for _ in range(3)]
+                assert len(set(paths)) == 3
+                with socket.socket(socket.AF_UNIX) as sock:
+                    sock.bind(paths[0])
+                with open("socket_dir.txt", "w") as f:
+                    f.write(os.path.dirname(paths[0]))
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+    socket_dir = (pytester.path / "socket_dir.txt").read_text()
+    assert not os.path.exists(socket_dir)
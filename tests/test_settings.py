@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import sys
+from textwrap import dedent
+
+import pytest
+from pytest import Pytester
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 11),
+    reason="asyncio_loop_thread requires Python 3.11 or newer",
+)
+def test_settings_match_ini_values(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_mode = auto
+            asyncio_debug = true
+            asyncio_loop_stats = true
+            asyncio_default_fixture_loop_scope = module
+            asyncio_default_test_loop_scope = class
+            asyncio_default_timeout = 2.5
+            asyncio_leaked_tasks = warn
+            asyncio_task_factory = default
+            asyncio_concurrent_fixture_setup = true
+            asyncio_concurrent_fixture_teardown = true
+            asyncio_function_loop_pool = true
+            asyncio_loop_thread = true
+            asyncio_propagate_fixture_context = false
+            asyncio_shared_executor = true
+            asyncio_shared_executor_workers = 3
+            """))
+    pytester.makepyfile(dedent("""\
+            from pytest_asyncio.plugin import Mode, _get_settings
+
+            def test_settings(request):
+                assert _get_settings(request.config)._asdict() == {
+                    "mode": Mode.AUTO,
+                    "debug": True,
+                    "loop_stats": True,
+                    "default_fixture_loop_scope": "module",
+                    "default_test_loop_scope": "class",
+                    "default_timeout": 2.5,
+                    "leaked_tasks_mode": "warn",
+                    "task_factory_name": "default",
+                    "concurrent_fixture_setup": True,
+                    "concurrent_fixture_teardown": True,
+                    "function_loop_pool": True,
+                    "loop_thread": True,
+                    "propagate_fixture_context": False,
+                    "shared_executor": True,
+                    "shared_executor_workers": 3,
+                }
+            """))
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1)
+
+
+def test_settings_match_command_line_options(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_mode = strict
+            asyncio_debug = false
+            asyncio_loop_stats = false
+            asyncio_default_fixture_loop_scope = function
+            asyncio_function_loop_pool = false
+            """))
+    pytester.makepyfile(dedent("""\
+            from pytest_asyncio.plugin import Mode, _get_settings
+
+            def test_settings(request):
+                settings = _get_settings(request.config)
+                assert settings.mode == Mode.AUTO
+                assert settings.debug is True
+                assert settings.loop_stats is True
+                assert settings.function_loop_pool is True
+                assert settings.propagate_fixture_context is True
+                assert settings.default_timeout is None
+                assert settings.shared_executor_workers is None
+            """))
+    result = pytester.runpytest(
+        "--asyncio-mode=auto",
+        "--asyncio-debug",
+        "--asyncio-loop-stats",
+        "-o",
+        "asyncio_function_loop_pool=true",
+    )
+    result.assert_outcomes(passed=1)
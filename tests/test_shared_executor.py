@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from textwrap import dedent
+
+from pytest import Pytester
+
+
+def test_loops_share_default_executor(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_shared_executor = true
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            from threading import current_thread
+            import pytest
+
+            threads = []
+
+            @pytest.mark.asyncio
+            async def test_first():
+                loop = asyncio.get_running_loop()
+                threads.append(await loop.run_in_executor(None, current_thread))
+
+            @pytest.mark.asyncio(loop_scope="module")
+            async def test_second():
+                loop = asyncio.get_running_loop()
+                threads.append(await loop.run_in_executor(None, current_thread))
+                assert threads[0] is threads[1]
+                assert threads[1].name.startswith("pytest-asyncio")
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=2)
+
+
+def test_loops_use_own_default_executor_by_default(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            from threading import current_thread
+            import pytest
+
+            threads = []
+
+            @pytest.mark.asyncio
+            async def test_first():
+                loop = asyncio.get_running_loop()
+                threads.append(await loop.run_in_executor(None, current_thread))
+
+            @pytest.mark.asyncio
+            async def test_second():
+                loop = asyncio.get_running_loop()
+                threads.append(await loop.run_in_executor(None, current_thread))
+                assert threads[0] is not threads[1]
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=2)
+
+
+def test_shared_executor_survives_closed_loops(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_shared_executor = true
+            asyncio_function_loop_pool = true
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+
+            @pytest.mark.asyncio
+            @pytest.mark.parametrize("n", range(3))
+            async def test_run_in_executor(n):
+                loop = asyncio.get_running_loop()
+                assert await loop.run_in_executor(None, abs, -n) == n
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=3)
+
+
+def test_shared_executor_workers_limits_threads(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_shared_executor = true
+            asyncio_shared_executor_workers = 1
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            from threading import current_thread
+            import pytest
+
+            @pytest.mark.asyncio
+            async def test_single_worker():
+                loop = asyncio.get_running_loop()
+                threads = await asyncio.gather(
+                    *(loop.run_in_executor(None, current_thread) for _ in range(5))
+                )
+                assert len(set(threads)) == 1
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+def test_invalid_shared_executor_workers_is_a_usage_error(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_shared_executor_workers = many
+            """))
+    pytester.makepyfile("")
+    result = pytester.runpytest("--asyncio-mode=strict")
+    assert result.ret == 4
+    result.stderr.fnmatch_lines(
+        ["*'many' is not a valid asyncio_shared_executor_workers*"]
+    )
+
+
+def test_marker_enables_shared_executor(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            from threading import current_thread
+            import pytest
+
+            threads = []
+
+            @pytest.mark.asyncio(shared_executor=True)
+            async def test_first():
+                loop = asyncio.get_running_loop()
+                threads.append(await loop.run_in_executor(None, current_thread))
+
+            @pytest.mark.asyncio(shared_executor=True)
+            async def test_second():
+                loop = asyncio.get_running_loop()
+                threads.append(await loop.run_in_executor(None, current_thread))
+                assert threads[0] is threads[1]
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=2)
+
+
+def test_marker_disables_shared_executor(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_shared_executor = true
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            from threading import current_thread
+            import pytest
+
+            @pytest.mark.asyncio(shared_executor=False)
+            async def test_own_executor():
+                loop = asyncio.get_running_loop()
+                thread = await loop.run_in_executor(None, current_thread)
+                assert not thread.name.startswith("pytest-asyncio")
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+def test_marker_rejects_non_boolean_shared_executor(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+            import pytest
+
+            @pytest.mark.asyncio(shared_executor="yes")
+            async def test_anything():
+                pass
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(errors=1)
+    result.stdout.fnmatch_lines(["*'shared_executor' must be a boolean*"])
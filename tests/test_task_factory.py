@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import sys
+from textwrap import dedent
+
+import pytest
+from pytest import Pytester
+
+requires_eager_task_factory = pytest.mark.skipif(
+    sys.version_info < (3, 12),
+    reason="The eager task factory requires Python 3.12 or newer",
+)
+
+
+@requires_eager_task_factory
+def test_eager_task_factory_applies_to_all_loop_scopes(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_task_factory = eager
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+
+            async def finishes_synchronously():
+                return 1
+
+            @pytest.mark.asyncio
+            async def test_function_scoped_loop():
+                task = asyncio.create_task(finishes_synchronously())
+                assert task.done()
+
+            @pytest.mark.asyncio(loop_scope="module")
+            async def test_module_scoped_loop():
+                task = asyncio.create_task(finishes_synchronously())
+                assert task.done()
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=2)
+
+
+def test_default_task_factory_schedules_tasks(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+
+            async def finishes_synchronously():
+                return 1
+
+            @pytest.mark.asyncio
+            async def test_task_is_scheduled():
+                task = asyncio.create_task(finishes_synchronously())
+                assert not task.done()
+                assert await task == 1
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+@requires_eager_task_factory
+def test_marker_overrides_task_factory_for_the_test(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+
+            pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+            async def finishes_synchronously():
+                return 1
+
+            @pytest.mark.asyncio(loop_scope="module", task_factory="eager")
+            async def test_eager():
+                task = asyncio.create_task(finishes_synchronously())
+                assert task.done()
+
+            async def test_default_is_restored():
+                task = asyncio.create_task(finishes_synchronously())
+                assert not task.done()
+                await task
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=2)
+
+
+def test_invalid_task_factory_is_a_usage_error(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_task_factory = lazy
+            """))
+    pytester.makepyfile("")
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.stderr.fnmatch_lines(["*'lazy' is not a valid asyncio_task_factory*"])
+
+
+def test_marker_rejects_unknown_task_factory(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+            import pytest
+
+            @pytest.mark.asyncio(task_factory="lazy")
+            async def test_anything():
+                pass
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(errors=1)
+    result.stdout.fnmatch_lines(
+        ["*'task_factory' must be one of 'default' or 'eager'*"]
+    )
+
+
+@pytest.mark.skipif(
+    sys.version_info >= (3, 12),
+    reason="The eager task factory is available",
+)
+def test_eager_task_factory_is_rejected_on_old_python(pytester: Pytester):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_task_factory = eager
+            """))
+    pytester.makepyfile("")
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.stderr.fnmatch_lines(["*asyncio_task_factory = eager requires Python 3.12*"])
+
+
+def test_default_task_factory_keeps_task_factory_of_loop_factory(
+    pytester: Pytester,
+):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makeconftest(dedent("""\
+            import asyncio
+
+            class CustomTask(asyncio.Task):
+                pass
+
+            def custom_task_factory(loop, coro, **kwargs):
+                return CustomTask(coro, loop=loop, **kwargs)
+
+            def create_loop():
+                loop = asyncio.new_event_loop()
+                loop.set_task_factory(custom_task_factory)
+                return loop
+
+            def pytest_asyncio_loop_factories(config, item):
+                return {"custom": create_loop}
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+            from conftest import CustomTask
+
+            @pytest.mark.asyncio(task_factory="default")
+            async def test_function_scoped_loop():
+                assert isinstance(asyncio.current_task(), CustomTask)
+
+            @pytest.mark.asyncio(loop_scope="module", task_factory="default")
+            async def test_module_scoped_loop():
+                assert isinstance(asyncio.current_task(), CustomTask)
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=2)
+
+
+@requires_eager_task_factory
+def test_default_task_factory_overrides_configured_task_factory(
+    pytester: Pytester,
+):
+    pytester.makeini(dedent("""\
+            [pytest]
+            asyncio_default_fixture_loop_scope = function
+            asyncio_task_factory = eager
+            """))
+    pytester.makepyfile(dedent("""\
+            import asyncio
+            import pytest
+
+            async def finishes_synchronously():
+                return 1
+
+            @pytest.mark.asyncio(task_factory="default")
+            async def test_task_is_scheduled():
+                task = asyncio.create_task(finishes_synchronously())
+                assert not task.done()
+                assert await task == 1
+            """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from textwrap import dedent
+
+import pytest
+from pytest import Pytester
+
+
+def test_timeout_marker_cancels_hanging_test(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+        import asyncio
+
+        import pytest
+
+        async def background_worker():
+            await asyncio.Event().wait()
+
+        @pytest.mark.asyncio(timeout=0.2)
+        async def test_hangs():
+            task = asyncio.create_task(background_worker())
+            await asyncio.Event().wait()
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(
+        ["*Test coroutine did not complete within 0.2 seconds and was cancelled."]
+    )
+    result.stdout.fnmatch_lines(["*line 11, in test_hangs"])
+    result.stdout.fnmatch_lines(["*Stack for <Task*background_worker*"])
+
+
+def test_timeout_fails_test_that_catches_the_cancellation(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+        import asyncio
+
+        import pytest
+
+        @pytest.mark.asyncio(timeout=0.2)
+        async def test_cleans_up_on_cancellation():
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                pass
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(
+        ["*Test coroutine did not complete within 0.2 seconds and was cancelled."]
+    )
+
+
+def test_timeout_marker_does_not_affect_fast_test(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+        import asyncio
+
+        import pytest
+
+        @pytest.mark.asyncio(timeout=5)
+        async def test_finishes():
+            await asyncio.sleep(0)
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+def test_default_timeout_applies_to_all_tests(pytester: Pytester):
+    pytester.makeini(dedent("""\
+        [pytest]
+        asyncio_default_fixture_loop_scope = function
+        asyncio_default_timeout = 0.2
+        """))
+    pytester.makepyfile(dedent("""\
+        import asyncio
+
+        import pytest
+
+        @pytest.mark.asyncio
+        async def test_hangs():
+            await asyncio.Event().wait()
+
+        @pytest.mark.asyncio(timeout=None)
+        async def test_opts_out():
+            await asyncio.sleep(0.4)
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1, failed=1)
+
+
+def test_timeout_uses_wall_clock_with_virtual_time(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+        import asyncio
+
+        import pytest
+
+        @pytest.mark.asyncio(loop_factories=["virtual_time"], timeout=5)
+        async def test_sleeps_long_in_virtual_time():
+            await asyncio.sleep(3600)
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+def test_test_that_swallows_other_cancellation_is_not_reported_as_timeout(
+    pytester: Pytester,
+):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+        import asyncio
+
+        import pytest
+
+        @pytest.mark.asyncio(timeout=5)
+        async def test_cancelled():
+            asyncio.current_task().cancel()
+            await asyncio.sleep(0)
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(failed=1)
+    result.stdout.no_fnmatch_line("*did not complete within*")
+
+
+@pytest.mark.parametrize("timeout", ('"soon"', "-1", "True"))
+def test_invalid_timeout_marker_value_raises_error(pytester: Pytester, timeout: str):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent(f"""\
+        import pytest
+
+        @pytest.mark.asyncio(timeout={timeout})
+        async def test_anything():
+            pass
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(errors=1)
+    result.stdout.fnmatch_lines(["*mark.asyncio 'timeout' must be*"])
+
+
+def test_invalid_default_timeout_raises_usage_error(pytester: Pytester):
+    pytester.makeini(dedent("""\
+        [pytest]
+        asyncio_default_fixture_loop_scope = function
+        asyncio_default_timeout = soon
+        """))
+    pytester.makepyfile(dedent("""\
+        async def test_anything():
+            pass
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.stderr.fnmatch_lines(["*'soon' is not a valid asyncio_default_timeout*"])
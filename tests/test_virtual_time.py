@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+from textwrap import dedent
+
+from pytest import Pytester
+
+
+def test_virtual_time_factory_can_be_selected_without_hook(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+        import asyncio
+        import time
+
+        import pytest
+
+        import pytest_asyncio
+
+        @pytest.mark.asyncio(loop_factories=["virtual_time"])
+        async def test_sleep_is_instant():
+            loop = asyncio.get_running_loop()
+            assert isinstance(loop, pytest_asyncio.VirtualTimeEventLoop)
+            wall_clock_start = time.monotonic()
+            virtual_start = loop.time()
+            await asyncio.sleep(3600)
+            assert loop.time() - virtual_start >= 3600
+            assert time.monotonic() - wall_clock_start < 1
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+def test_virtual_time_preserves_callback_order(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+        import asyncio
+
+        import pytest
+
+        @pytest.mark.asyncio(loop_factories=["virtual_time"])
+        async def test_sleeps_finish_in_order():
+            finished = []
+
+            async def sleep_and_record(delay):
+                await asyncio.sleep(delay)
+                finished.append(delay)
+
+            await asyncio.gather(*(sleep_and_record(d) for d in (30, 10, 20, 0)))
+            assert finished == [0, 10, 20, 30]
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+def test_virtual_time_expires_timeouts(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+        import asyncio
+
+        import pytest
+
+        @pytest.mark.asyncio(loop_factories=["virtual_time"])
+        async def test_timeout():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(asyncio.Event().wait(), timeout=600)
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+def test_virtual_time_loop_still_processes_io(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+        import asyncio
+
+        import pytest
+
+        @pytest.mark.asyncio(loop_factories=["virtual_time"])
+        async def test_io():
+            async def echo(reader, writer):
+                writer.write(await reader.readline())
+                await writer.drain()
+                writer.close()
+
+            server = await asyncio.start_server(echo, host="127.0.0.1", port=0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"ping\\n")
+            assert await reader.readline() == b"ping\\n"
+            writer.close()
+            await writer.wait_closed()
+            server.close()
+            await server.wait_closed()
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+def test_virtual_time_factory_can_be_returned_by_hook(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makeconftest(dedent("""\
+        import pytest_asyncio
+
+        def pytest_asyncio_loop_factories(config, item):
+            return {"virtual": pytest_asyncio.VirtualTimeEventLoop}
+        """))
+    pytester.makepyfile(dedent("""\
+        import asyncio
+
+        import pytest
+
+        import pytest_asyncio
+
+        @pytest.mark.asyncio
+        async def test_uses_virtual_time():
+            loop = asyncio.get_running_loop()
+            assert isinstance(loop, pytest_asyncio.VirtualTimeEventLoop)
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+def test_virtual_time_factory_is_not_added_to_hook_factories(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makeconftest(dedent("""\
+        import asyncio
+
+        def pytest_asyncio_loop_factories(config, item):
+            return {"default": asyncio.new_event_loop}
+        """))
+    pytester.makepyfile(dedent("""\
+        import pytest
+
+        @pytest.mark.asyncio
+        async def test_runs_once():
+            pass
+
+        @pytest.mark.asyncio(loop_factories=["default", "virtual_time"])
+        async def test_runs_twice():
+            pass
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=3)
+
+
+def test_virtual_time_waits_for_executor_jobs(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+        import asyncio
+        import time
+
+        import pytest
+
+        @pytest.mark.asyncio(loop_factories=["virtual_time"])
+        async def test_executor_job_completes_before_timeout():
+            await asyncio.wait_for(asyncio.to_thread(time.sleep, 0.1), timeout=5)
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
+
+
+def test_virtual_time_waits_for_pending_io(pytester: Pytester):
+    pytester.makeini("[pytest]\nasyncio_default_fixture_loop_scope = function")
+    pytester.makepyfile(dedent("""\
+        import asyncio
+        import socket
+        import threading
+
+        import pytest
+
+        @pytest.mark.asyncio(loop_factories=["virtual_time"])
+        async def test_read_completes_before_timeout():
+            ours, theirs = socket.socketpair()
+            reader, writer = await asyncio.open_connection(sock=ours)
+            threading.Timer(0.1, theirs.sendall, args=(b"ping\\n",)).start()
+            assert await asyncio.wait_for(reader.readline(), timeout=5) == b"ping\\n"
+            writer.close()
+            await writer.wait_closed()
+            theirs.close()
+        """))
+    result = pytester.runpytest("--asyncio-mode=strict")
+    result.assert_outcomes(passed=1)
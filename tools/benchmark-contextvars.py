@@ -0,0 +1,145 @@
+"""
+Measures the setup of async fixtures in the presence of many contextvars.
+
+The suite registers a large number of contextvars, similar to applications
+that use tracing or structured logging, and runs parametrized tests that
+request several async fixtures each. One of the fixtures sets a contextvar,
+the others leave the context alone. The suite is run once with the current
+contextvar propagation of pytest-asyncio and once with a propagation that
+compares every variable of the context, which is how pytest-asyncio behaved
+before. Each run uses a separate interpreter.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextvars
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from textwrap import dedent
+
+import pytest
+
+import pytest_asyncio.plugin
+
+CONFTEST = dedent("""\
+    import contextvars
+
+    import pytest_asyncio
+
+    request_id = contextvars.ContextVar("request_id")
+    for index in range({contextvars}):
+        contextvars.ContextVar(f"var_{{index}}").set(index)
+
+    @pytest_asyncio.fixture
+    async def setting_fixture():
+        request_id.set("abc")
+    """)
+
+FIXTURE = dedent("""\
+    @pytest_asyncio.fixture
+    async def fixture_{index}():
+        return {index}
+    """)
+
+TEST_MODULE = dedent("""\
+    import pytest
+    import pytest_asyncio
+
+    {fixtures}
+
+    @pytest.mark.parametrize("n", range({items}))
+    async def test_fixtures(n, setting_fixture, {fixture_names}):
+        pass
+    """)
+
+
+def compare_all_contextvars(
+    context: contextvars.Context,
+) -> Callable[[], None] | None:
+    context_tokens = []
+    for var in context:
+        try:
+            if var.get() is context.get(var):
+                continue
+        except LookupError:
+            pass
+        token = var.set(context.get(var))
+        context_tokens.append((var, token))
+
+    if not context_tokens:
+        return None
+
+    def restore_contextvars():
+        while context_tokens:
+            var, token = context_tokens.pop()
+            var.reset(token)
+
+    return restore_contextvars
+
+
+def run(path: Path, *, compare_all: bool) -> None:
+    if compare_all:
+        pytest_asyncio.plugin._apply_contextvar_changes = compare_all_contextvars
+    exit_code = pytest.main(
+        [
+            "--quiet",
+            "--asyncio-mode=auto",
+            "-o",
+            "asyncio_default_fixture_loop_scope=function",
+            "-p",
+            "no:cacheprovider",
+            str(path),
+        ],
+    )
+    if exit_code != pytest.ExitCode.OK:
+        raise RuntimeError(f"Test run failed with exit code {exit_code}")
+
+
+def timed_run(path: Path, *, compare_all: bool) -> float:
+    command = [sys.executable, __file__, "--run", str(path)]
+    if compare_all:
+        command.append("--compare-all")
+    start = time.perf_counter()
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--contextvars", type=int, default=1000)
+    parser.add_argument("--fixtures", type=int, default=20)
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--run", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--compare-all", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.run is not None:
+        return run(args.run, compare_all=args.compare_all)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp)
+        (path / "conftest.py").write_text(CONFTEST.format(contextvars=args.contextvars))
+        (path / "test_fixtures.py").write_text(
+            TEST_MODULE.format(
+                fixtures="\n".join(
+                    FIXTURE.format(index=index) for index in range(args.fixtures)
+                ),
+                items=args.items,
+                fixture_names=", ".join(
+                    f"fixture_{index}" for index in range(args.fixtures)
+                ),
+            )
+        )
+        current_duration = timed_run(path, compare_all=False)
+        compare_all_duration = timed_run(path, compare_all=True)
+    fixtures = (args.fixtures + 1) * args.items
+    print(f"Set up {fixtures} async fixtures with {args.contextvars} contextvars")
+    print(f"current:     {current_duration:.2f}s")
+    print(f"compare all: {compare_all_duration:.2f}s")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
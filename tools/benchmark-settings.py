@@ -0,0 +1,127 @@
+"""
+Measures the per-item overhead of the pytest-asyncio hooks.
+
+The suite consists of parametrized async tests that request a few async
+fixtures, so that every item passes through the hot hooks of pytest-asyncio.
+It is run once with the settings that pytest-asyncio resolves when pytest is
+configured and once with settings that parse the pytest configuration on every
+access, which is how pytest-asyncio behaved before the settings were resolved
+up front. Each run uses a separate interpreter.
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from textwrap import dedent
+from typing import Any
+
+import pytest
+from pytest import Config
+
+import pytest_asyncio.plugin
+
+TEST_MODULE = dedent("""\
+    import pytest
+    import pytest_asyncio
+
+    @pytest_asyncio.fixture
+    async def first():
+        return 1
+
+    @pytest_asyncio.fixture
+    async def second(first):
+        yield first + 1
+
+    @pytest_asyncio.fixture
+    async def third(second):
+        return second + 1
+
+    @pytest.mark.parametrize("n", range({items}))
+    async def test_fixtures(n, third):
+        assert third == 3
+    """)
+
+SETTING_PARSERS = {
+    "mode": "_parse_asyncio_mode",
+    "debug": "_parse_asyncio_debug",
+    "loop_stats": "_parse_asyncio_loop_stats",
+}
+BOOL_SETTINGS = {
+    "concurrent_fixture_setup",
+    "concurrent_fixture_teardown",
+    "function_loop_pool",
+    "loop_thread",
+    "propagate_fixture_context",
+    "shared_executor",
+}
+
+
+class UnresolvedSettings:
+    """Settings that are parsed from the configuration on every access."""
+
+    def __init__(self, config: Config) -> None:
+        self._config = config
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "default_fixture_loop_scope":
+            return self._config.getini("asyncio_default_fixture_loop_scope")
+        if name in BOOL_SETTINGS:
+            return pytest_asyncio.plugin._parse_bool_ini(
+                self._config, f"asyncio_{name}"
+            )
+        parser = SETTING_PARSERS.get(name, f"_parse_{name}")
+        return getattr(pytest_asyncio.plugin, parser)(self._config)
+
+
+def run(path: Path, *, unresolved: bool) -> None:
+    if unresolved:
+        pytest_asyncio.plugin._get_settings = UnresolvedSettings  # type: ignore[assignment]
+    exit_code = pytest.main(
+        [
+            "--quiet",
+            "--asyncio-mode=auto",
+            "-o",
+            "asyncio_default_fixture_loop_scope=function",
+            "-p",
+            "no:cacheprovider",
+            str(path),
+        ],
+    )
+    if exit_code != pytest.ExitCode.OK:
+        raise RuntimeError(f"Test run failed with exit code {exit_code}")
+
+
+def timed_run(path: Path, *, unresolved: bool) -> float:
+    command = [sys.executable, __file__, "--run", str(path)]
+    if unresolved:
+        command.append("--unresolved")
+    start = time.perf_counter()
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--run", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--unresolved", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.run is not None:
+        return run(args.run, unresolved=args.unresolved)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp)
+        (path / "test_fixtures.py").write_text(TEST_MODULE.format(items=args.items))
+        resolved_duration = timed_run(path, unresolved=False)
+        unresolved_duration = timed_run(path, unresolved=True)
+    print(f"Ran {args.items} items")
+    print(f"resolved:   {resolved_duration / args.items * 1e6:.0f}us per item")
+    print(f"unresolved: {unresolved_duration / args.items * 1e6:.0f}us per item")
+
+
+if __name__ == "__main__":
+    sys.exit(main())